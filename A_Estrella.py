@@ -1,134 +1,59 @@
-import matplotlib.pyplot as plt
-import numpy as np
-import random
+from functools import partial
+import Grid_Renderer
+from Grid_Generator import make_rng, initialize_grid, generar_obstaculos, generar_inicio_meta, is_valid, manhattan_distance
+from Astar import a_star as astar_en, bidirectional_a_star, jump_point_search
+
+dibujar_cuadricula = partial(Grid_Renderer.dibujar_cuadricula, estilo='a_star')
+
+# Versión en español de Astar.py: las funciones son envolturas delgadas del mismo motor.
 
 # Inicializa una cuadrícula de tamaño 'n' y la llena de ceros.
 def inicializar_cuadricula(n):
-    return np.zeros((n, n), dtype=int)
+    return initialize_grid(n)
 
 # Comprueba si una posición (x, y) es válida en la cuadrícula y no es un obstáculo (valor 1).
 def es_valida(x, y, cuadricula):
-    return 0 <= x < len(cuadricula) and 0 <= y < len(cuadricula[0]) and cuadricula[x][y] == 0
-
-# Genera obstáculos aleatorios en la cuadrícula.
-def generar_obstaculos(cuadricula, n):
-    for _ in range(n):
-        x, y = random.randint(0, len(cuadricula) - 1), random.randint(0, len(cuadricula[0]) - 1)
-        while cuadricula[x][y] == 1:
-            x, y = random.randint(0, len(cuadricula) - 1), random.randint(0, len(cuadricula[0]) - 1)
-        cuadricula[x][y] = 1
-
-# Genera posiciones de inicio y meta en la cuadrícula sin obstáculos.
-def generar_inicio_meta(cuadricula):
-    celdas_libres = [(x, y) for x in range(len(cuadricula)) for y in range(len(cuadricula[0])) if cuadricula[x][y] == 0]
-    if len(celdas_libres) < 2:
-        raise ValueError("La cuadrícula no tiene suficientes celdas libres para establecer el inicio y la meta.")
-    inicio, meta = random.sample(celdas_libres, 2)
-    return inicio, meta
+    return is_valid(x, y, cuadricula)
 
 # Calcula la distancia de Manhattan entre dos puntos en la cuadrícula.
 def distancia_manhattan(punto1, punto2):
-    return abs(punto1[0] - punto2[0]) + abs(punto1[1] - punto2[1])
-
-def a_star(cuadricula, inicio, meta):
-    open_set = [inicio]  # Conjunto de nodos abiertos para explorar.
-    came_from = {}  # Diccionario para rastrear cómo llegamos a cada nodo.
-    
-    g_n = {(celda[0], celda[1]): float('inf') for celda in np.ndindex(cuadricula.shape)}  # g_n para cada celda.
-    g_n[inicio] = 0  # El g_n del inicio es 0.
-
-    f_n = {(celda[0], celda[1]): float('inf') for celda in np.ndindex(cuadricula.shape)}  # f_n para cada celda.
-    f_n[inicio] = distancia_manhattan(inicio, meta)  # Estimación inicial de f_n.
-
-    while open_set:
-        current = min(open_set, key=lambda celda: f_n[celda])  # Selecciona el nodo con el f_n más bajo.
-
-        if current == meta:  # Si hemos llegado a la meta, reconstruimos el camino y lo devolvemos.
-            camino = reconstruir_camino(came_from, current)
-            return camino
-
-        open_set.remove(current)  # Removemos el nodo actual del conjunto abierto.
+    return manhattan_distance(punto1, punto2)
 
-        for neighbor in [(current[0], current[1] + 1), (current[0], current[1] - 1), (current[0] + 1, current[1]), (current[0] - 1, current[1])]:
-            if es_valida(neighbor[0], neighbor[1], cuadricula):
-                tentative_g_n = g_n[current] + 1  # Calcula el g_n tentativo.
+def a_star(cuadricula, inicio, meta, estadisticas=None, componentes=None, campo=None, conectividad=4, esquinas='none',
+           heuristica=None, desempate='fifo'):
+    # A* con la distancia de Manhattan; devuelve el camino más corto o None si no hay.
+    # Con conectividad=8 se mueve también en diagonal (esquinas: 'allow', 'one' o 'none') con la heurística
+    # octil; desempate elige el orden entre empates de f ('fifo', 'lifo', 'high_g' o 'low_g').
+    # Con un campo de distancia a la meta (Distance_Field.goal_field) la heurística es la distancia exacta.
+    return astar_en(cuadricula, inicio, meta, estadisticas, componentes, campo, conectividad, esquinas, heuristica, desempate)
 
-                if tentative_g_n < g_n[neighbor]:
-                    came_from[neighbor] = current  # Almacenamos cómo llegamos a esta celda.
-                    g_n[neighbor] = tentative_g_n  # Actualizamos el g_n.
-                    f_n[neighbor] = g_n[neighbor] + distancia_manhattan(neighbor, meta)  # Actualizamos el f_n.
 
-                    if neighbor not in open_set:
-                        open_set.append(neighbor)  # Agregamos el vecino al conjunto abierto.
+# A* bidireccional: busca desde el inicio y desde la meta a la vez con la distancia de Manhattan
+# y se detiene cuando ningún camino por descubrir puede mejorar el encontrado. Devuelve un camino óptimo.
+def a_star_bidireccional(cuadricula, inicio, meta, estadisticas=None, componentes=None):
+    return bidirectional_a_star(cuadricula, inicio, meta, estadisticas, componentes)
 
-    return None  # Si no se encuentra un camino, retornamos None.
 
+# Jump Point Search: A* que solo expande puntos de salto y recorre en línea recta los tramos entre ellos.
+# Da caminos de la misma longitud que a_star expandiendo muchos menos nodos.
+def busqueda_puntos_de_salto(cuadricula, inicio, meta, estadisticas=None, componentes=None):
+    return jump_point_search(cuadricula, inicio, meta, estadisticas, componentes)
 
-# Reconstruye el camino desde la meta hasta el inicio.
-def reconstruir_camino(came_from, actual):
-    camino_total = [actual]
-    while actual in came_from:
-        actual = came_from[actual]
-        camino_total.insert(0, actual)
-    return camino_total
 
-# Dibuja la cuadrícula con inicio, meta y el camino encontrado.
-def dibujar_cuadricula(cuadricula, inicio, meta, camino, visitados):
-    fig, ax = plt.subplots()
-
-    ax.set_facecolor('white')
-    tamano_celda = 1
-
-    for i in range(len(cuadricula)):
-        for j in range(len(cuadricula[0])):
-            if cuadricula[i][j] == 1:
-                ax.add_patch(plt.Rectangle((j * tamano_celda, i * tamano_celda), tamano_celda, tamano_celda, color='black'))
-            elif cuadricula[i][j] == 0:
-                if meta:
-                    distancia = distancia_manhattan((i, j), meta)
-                    maxima_distancia = max(len(cuadricula), len(cuadricula[0]))
-                    valor_calor = 1 - (distancia / maxima_distancia)
-                    color = plt.cm.viridis(valor_calor)
-                else:
-                    color = 'white'
-
-                ax.add_patch(plt.Rectangle((j * tamano_celda, i * tamano_celda), tamano_celda, tamano_celda, color=color))
-
-    plt.scatter(inicio[1] * tamano_celda + tamano_celda / 2, inicio[0] * tamano_celda + tamano_celda / 2, color='white', marker='o',
-                s=100)
-    plt.scatter(meta[1] * tamano_celda + tamano_celda / 2, meta[0] * tamano_celda + tamano_celda / 2, color='red', marker='x',
-                s=100)
-
-    if camino:
-        camino_x, camino_y = zip(*camino)
-        camino_x = [x * tamano_celda + tamano_celda / 2 for x in camino_x]
-        camino_y = [y * tamano_celda + tamano_celda / 2 for y in camino_y]
-        plt.plot(camino_y, camino_x, color='white', label='Camino')
-
-    if visitados:
-        visitados_x, visitados_y = zip(*visitados)
-        visitados_x = [x * tamano_celda + tamano_celda / 2 for x in visitados_x]
-        visitados_y = [y * tamano_celda + tamano_celda / 2 for y in visitados_y]
-        for i, (x, y) in enumerate(zip(visitados_x, visitados_y), 1):
-            plt.text(y, x, str(i), ha='center', va='center', color='white', fontsize=14)
-
-    for i in range(len(cuadricula) + 1):
-        plt.axhline(y=i * tamano_celda, color='black', linewidth=0.1)
-    for j in range(len(cuadricula[0]) + 1):
-        plt.axvline(x=j * tamano_celda, color='black', linewidth=0.1)
-
-    plt.legend()
-    plt.show()
+# Reconstruye el camino desde la meta hasta el inicio siguiendo el arreglo de padres.
+def reconstruir_camino(estado, actual):
+    return estado.path_to(actual)
 
 # Función principal que ejecuta el algoritmo.
 def main():
     n = 10
     cuadricula = inicializar_cuadricula(n)
     num_obstaculos = (n * n) // 4
-    generar_obstaculos(cuadricula, num_obstaculos)
+    rng = make_rng()
+    generar_obstaculos(cuadricula, num_obstaculos, rng)
 
     try:
-        inicio, meta = generar_inicio_meta(cuadricula)
+        inicio, meta = generar_inicio_meta(cuadricula, rng)
     except ValueError as e:
         print(e)
         return
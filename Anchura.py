@@ -0,0 +1,44 @@
+from Grid_Renderer import dibujar_cuadricula
+from Grid_Generator import make_rng, initialize_grid, generar_obstaculos, generar_inicio_meta
+from BFS import bfs, bidirectional_bfs
+
+def inicializar_cuadricula(n):
+    # Crea una cuadrícula de tamaño NxN con todos los elementos inicializados en 0.
+    return initialize_grid(n)
+
+def busqueda_bfs(cuadricula, inicio, meta, estadisticas=None, componentes=None):
+    # Búsqueda en anchura: expande una capa completa de la frontera por paso con NumPy.
+    # Devuelve la lista de nodos expandidos en orden y el camino más corto (vacío si no existe).
+    return bfs(cuadricula, inicio, meta, estadisticas, componentes)
+
+def busqueda_bfs_bidireccional(cuadricula, inicio, meta, estadisticas=None, componentes=None):
+    # BFS desde el inicio y desde la meta a la vez, una capa completa del lado más pequeño por paso.
+    return bidirectional_bfs(cuadricula, inicio, meta, estadisticas, componentes)
+
+
+def main():
+    n = 10  # Tamaño de la cuadrícula (NxN)
+    cuadricula = inicializar_cuadricula(n)
+
+    # Genera obstáculos aleatorios (N^2/4 obstáculos)
+    num_obstaculos = (n * n) // 4
+    rng = make_rng()
+    generar_obstaculos(cuadricula, num_obstaculos, rng)
+
+    try:
+        inicio, meta = generar_inicio_meta(cuadricula, rng)
+    except ValueError as e:
+        print(e)
+        return
+
+    visitados, camino = busqueda_bfs(cuadricula, inicio, meta)
+    if camino:
+        print("Camino encontrado:", camino)
+        print("Camino recorrido:", visitados)
+    else:
+        print("No se encontró un camino válido.")
+
+    dibujar_cuadricula(cuadricula, inicio, meta, camino, visitados)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import heapq
+import time
+import numpy as np
+from Grid_Generator import STRAIGHT, DIAGONAL, DIAGONAL_MOVES, CORNER_RULES
+from Search_State import INF, SearchState, lazy_zeros
+
+# Revisa el reloj cada tantas expansiones: consultar perf_counter en cada nodo costaría más que la búsqueda.
+CLOCK_INTERVAL = 256
+
+
+def anytime_solutions(grid, start, goal, epsilon=3.0, decrement=0.5, timeout=None, stats=None, components=None,
+                      connectivity=4, corner='none'):
+    # A* anytime al estilo ARA*: la primera búsqueda usa la heurística inflada por 'epsilon' (rápida, con
+    # un camino a lo sumo 'epsilon' veces el óptimo) y cada ronda baja epsilon en 'decrement' reutilizando
+    # lo ya explorado, hasta llegar a 1 (el óptimo).
+    # Produce (camino, cota) cada vez que hay un camino nuevo; 'cota' es un factor demostrado: el costo del
+    # camino es a lo sumo cota * costo óptimo (1.0 cuando ya es óptimo).
+    # Con 'timeout' (segundos) se deja de producir caminos al vencer el plazo.
+    # connectivity y corner funcionan como en a_star (pasos de 1, o de STRAIGHT y DIAGONAL con 8 vecinos).
+    if connectivity not in (4, 8):
+        raise ValueError("La conectividad debe ser 4 u 8: " + str(connectivity))
+    if corner not in CORNER_RULES:
+        raise ValueError("Regla de esquinas desconocida: " + str(corner))
+    if epsilon < 1 or decrement <= 0:
+        raise ValueError("Se necesita epsilon >= 1 y decrement > 0.")
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    if components is not None and not components.reachable(start, goal):
+        return
+
+    # Estado perezoso: g + 1, padre + 1, la ronda de cierre y la marca de abierta empiezan en 0 y solo se
+    # tocan las páginas de las celdas alcanzadas, así que preparar la búsqueda no depende del tamaño de
+    # la cuadrícula y el plazo cuenta desde la primera expansión.
+    state = SearchState(grid, with_g=True)
+    rows, cols = state.rows, state.cols
+    cells = memoryview(state.cells)
+    g, parent = memoryview(state.g), memoryview(state.parent)
+    closed = memoryview(lazy_zeros(state.size, np.int32))  # Ronda en la que se cerró cada celda (0 = nunca)
+    in_open = memoryview(state.visited)
+    start_id, goal_id = state.cell_id(start), state.cell_id(goal)
+    if cells[start_id] or cells[goal_id]:
+        return
+    if deadline is not None and time.perf_counter() > deadline:
+        return
+
+    # Vecinos: (dx, dy, desplazamiento, costo, lados) donde 'lados' son los dos desplazamientos rectos que
+    # la regla de esquinas revisa antes de una diagonal (None en los movimientos rectos).
+    straight = 1 if connectivity == 4 else STRAIGHT
+    steps = [(0, 1, 1, straight, None), (0, -1, -1, straight, None),
+             (1, 0, cols, straight, None), (-1, 0, -cols, straight, None)]
+    if connectivity == 8:
+        steps += [(dx, dy, dx * cols + dy, DIAGONAL, (dx * cols, dy)) for dx, dy in DIAGONAL_MOVES]
+    gx, gy = goal
+
+    def h(cell_id):
+        dx, dy = abs(cell_id // cols - gx), abs(cell_id % cols - gy)
+        if connectivity == 4:
+            return dx + dy
+        return STRAIGHT * max(dx, dy) + (DIAGONAL - STRAIGHT) * min(dx, dy)
+
+    incons = set()  # Celdas que mejoraron después de cerrarse en la ronda actual
+    g[start_id] = 1
+    # Montículo con (g + epsilon * h, -g, id): a igual clave, la más avanzada. Las entradas cuya clave ya no
+    # coincide con el g actual de la celda se descartan al sacarlas (borrado perezoso, como en a_star).
+    heap = [(epsilon * h(start_id), 0, start_id)]
+    in_open[start_id] = True
+    expanded = generated = reopened = peak = 0
+    reported = INF, INF  # Costo y cota del último camino producido
+
+    try:
+        current_round = 0
+        while True:
+            current_round += 1
+            # Mejora el camino con el epsilon actual (ImprovePath de ARA*).
+            while heap:
+                key, _, cell_id = heap[0]
+                if not in_open[cell_id] or key != g[cell_id] - 1 + epsilon * h(cell_id):
+                    heapq.heappop(heap)
+                    reopened += 1
+                    continue
+                if g[goal_id] and g[goal_id] - 1 <= key:
+                    break
+                if deadline is not None and expanded % CLOCK_INTERVAL == 0 and time.perf_counter() > deadline:
+                    return
+                heapq.heappop(heap)
+                in_open[cell_id] = False
+                closed[cell_id] = current_round
+                expanded += 1
+                x, y = divmod(cell_id, cols)
+                base = g[cell_id] - 1
+                for dx, dy, shift, cost, sides in steps:
+                    if not (0 <= x + dx < rows and 0 <= y + dy < cols):
+                        continue
+                    neighbor = cell_id + shift
+                    if cells[neighbor]:
+                        continue
+                    if sides is not None:
+                        side_a, side_b = not cells[cell_id + sides[0]], not cells[cell_id + sides[1]]
+                        if corner == 'none' and not (side_a and side_b) or corner == 'one' and not (side_a or side_b):
+                            continue
+                    known = g[neighbor]
+                    if not known or base + cost < known - 1:
+                        g[neighbor] = base + cost + 1
+                        parent[neighbor] = cell_id + 1
+                        generated += 1
+                        if closed[neighbor] == current_round:
+                            incons.add(neighbor)  # Se volverá a abrir en la próxima ronda
+                        else:
+                            in_open[neighbor] = True
+                            heapq.heappush(heap, (base + cost + epsilon * h(neighbor), -(base + cost), neighbor))
+                if len(heap) > peak:
+                    peak = len(heap)
+
+            if not g[goal_id]:
+                return  # No hay camino
+            cost = g[goal_id] - 1
+
+            # Cota demostrada: costo / (menor g + h sin inflar entre las celdas abiertas o inconsistentes).
+            pending = [cell_id for cell_id in incons]
+            pending += [cell_id for _, _, cell_id in heap if in_open[cell_id]]
+            lower = min((g[cell_id] - 1 + h(cell_id) for cell_id in pending), default=cost)
+            bound = max(min(epsilon, cost / lower) if lower else 1.0, 1.0)
+            if (cost, bound) < reported:  # Solo si mejoró el camino o su cota
+                reported = cost, bound
+                yield state.path_to(goal_id), bound
+            if epsilon <= 1 or bound <= 1:
+                return
+            if deadline is not None and time.perf_counter() > deadline:
+                return  # No vale la pena reconstruir la lista abierta para otra ronda
+
+            # Siguiente ronda: epsilon menor, y las inconsistentes vuelven a la lista abierta.
+            epsilon = max(1.0, epsilon - decrement)
+            for cell_id in incons:
+                in_open[cell_id] = True
+            incons = set()
+            heap = [(g[cell_id] - 1 + epsilon * h(cell_id), 1 - g[cell_id], cell_id) for cell_id in set(pending)]
+            heapq.heapify(heap)
+    finally:
+        if stats is not None:
+            stats.expanded += expanded
+            stats.generated += generated
+            stats.reopened += reopened
+            stats.peak_frontier = max(stats.peak_frontier, peak)
+
+
+def anytime_a_star(grid, start, goal, timeout=None, epsilon=3.0, decrement=0.5, stats=None, components=None,
+                   connectivity=4, corner='none'):
+    # Devuelve (camino, cota) del mejor camino encontrado antes de 'timeout' segundos (sin plazo, el
+    # óptimo con cota 1.0). Si no hay camino, o el plazo vence antes del primero, devuelve (None, None).
+    best = None, None
+    for best in anytime_solutions(grid, start, goal, epsilon, decrement, timeout, stats, components, connectivity, corner):
+        pass
+    return best
@@ -1,125 +1,72 @@
-import matplotlib.pyplot as plt
-import numpy as np
-import random
+from functools import partial
+import Grid_Renderer
+from Grid_Generator import make_rng, initialize_grid, generar_obstaculos, generar_inicio_meta, is_valid, manhattan_distance
+from Search_Stats import collect_events
+from Parallel_Climbing import parallel_climbing
+from Hill_Climbing import hill_climbing_events, hill_climbing_batch
+
+dibujar_cuadricula = partial(Grid_Renderer.dibujar_cuadricula, estilo='heat_map')
+
+# Versión en español de Hill_Climbing.py: las funciones son envolturas delgadas del mismo motor.
 
 def inicializar_cuadricula(n):
     # Crea una cuadrícula NxN con todos los elementos inicializados a 0.
-    return np.zeros((n, n), dtype=int)
+    return initialize_grid(n)
 
 def es_valida(x, y, cuadricula):
     # Verifica si las coordenadas (x, y) están dentro de la cuadrícula y no son un obstáculo (valor 1).
-    return 0 <= x < len(cuadricula) and 0 <= y < len(cuadricula[0]) and cuadricula[x][y] == 0
-
-def generar_obstaculos(cuadricula, n):
-    for _ in range(n):
-        x, y = random.randint(0, len(cuadricula) - 1), random.randint(0, len(cuadricula[0]) - 1)
-        while cuadricula[x][y] == 1:
-            x, y = random.randint(0, len(cuadricula) - 1), random.randint(0, len(cuadricula[0]) - 1)
-        cuadricula[x][y] = 1
-
-def generar_inicio_meta(cuadricula):
-    celdas_libres = [(x, y) for x in range(len(cuadricula)) for y in range(len(cuadricula[0])) if cuadricula[x][y] == 0]
-    if len(celdas_libres) < 2:
-        raise ValueError("La cuadrícula no tiene suficientes celdas libres para establecer el inicio y la meta.")
-    inicio, meta = random.sample(celdas_libres, 2)
-    return inicio, meta
+    return is_valid(x, y, cuadricula)
 
 def distancia_manhattan(punto1, punto2):
-    return abs(punto1[0] - punto2[0]) + abs(punto1[1] - punto2[1])
-
-def busqueda_ascenso_colina(cuadricula, inicio, meta, max_iteraciones):
-    # Inicializa las variables.
-    actual = inicio  # Comenzamos desde el punto de inicio.
-    visitados = set()  # Conjunto para rastrear los nodos visitados.
-    lista_visitados = []  # Lista para almacenar los nodos visitados en orden.
-    camino = []  # Lista para almacenar el camino seguido.
-    iteraciones = 0  # Contador de iteraciones.
-
-    # Mientras no lleguemos a la meta y no excedamos el número máximo de iteraciones:
-    while actual != meta and iteraciones < max_iteraciones:
-        visitados.add(actual)  # Marcamos el nodo actual como visitado.
-        lista_visitados.append(actual)  # Agregamos el nodo actual a la lista de nodos visitados.
-        camino.append(actual)  # Agregamos el nodo actual al camino.
-        x, y = actual
-
-        # Definimos movimientos posibles: arriba, abajo, izquierda, derecha.
-        movimientos = [(x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y)]
-        # Ordenamos los movimientos por su distancia manhattan a la meta.
-        movimientos.sort(key=lambda movimiento: distancia_manhattan(movimiento, meta))
-
-        # Iteramos a través de los movimientos y seleccionamos el primero válido no visitado.
-        for movimiento in movimientos:
-            if es_valida(movimiento[0], movimiento[1], cuadricula) and movimiento not in visitados:
-                actual = movimiento  # Actualizamos la posición actual.
-                break
-
-        iteraciones += 1  # Incrementamos el contador de iteraciones.
-
-    # Si se supera el número máximo de iteraciones, mostramos un mensaje.
-    if iteraciones >= max_iteraciones:
-        print("El algoritmo se atascó después de", max_iteraciones, "iteraciones.")
-
-    # Si llegamos a la meta, agregamos la posición de la meta al camino.
-    if actual == meta:
-        camino.append(meta)
-
-    # Devolvemos tanto el camino como la lista de nodos visitados.
+    return manhattan_distance(punto1, punto2)
+
+def busqueda_ascenso_colina(cuadricula, inicio, meta, max_iteraciones, estadisticas=None, componentes=None, campo=None,
+                            conectividad=4, esquinas='none'):
+    # Devuelve el camino seguido y la lista de nodos visitados en orden.
+    lista_visitados, camino = collect_events(busqueda_ascenso_colina_eventos(cuadricula, inicio, meta, max_iteraciones,
+                                                                             estadisticas, componentes, campo,
+                                                                             conectividad, esquinas))
     return camino, lista_visitados
 
+def busqueda_ascenso_colina_eventos(cuadricula, inicio, meta, max_iteraciones, estadisticas=None, componentes=None, campo=None,
+                                    conectividad=4, esquinas='none'):
+    # Versión generadora de busqueda_ascenso_colina: produce (celda, orden, opciones) en cada paso, con orden
+    # desde 1; no hay frontera, así que 'opciones' es el número de movimientos válidos no visitados. No guarda
+    # la lista de visitados; al terminar devuelve el camino (valor de StopIteration, o resultado de 'yield from').
+    # Con un campo de distancia a la meta (Distance_Field.goal_field) los movimientos se ordenan por
+    # la distancia real en vez de la manhattan; siempre hay un vecino más cercano y nunca se atasca.
+    # Con conectividad=8 también hay movimientos diagonales (según 'esquinas'), ordenados por distancia octil;
+    # el campo solo se acepta con 4 vecinos. Se valida aquí para que el error salga al llamar y no al iterar.
+    if campo is not None and conectividad != 4:
+        raise ValueError("El campo de distancia solo sirve para ordenar movimientos con 4 vecinos.")
+    return hill_climbing_events(cuadricula, inicio, meta, max_iteraciones, estadisticas, componentes, campo,
+                                conectividad, esquinas)
 
-def dibujar_cuadricula(cuadricula, inicio, meta, camino, visitados):
-    fig, ax = plt.subplots()
 
-    ax.set_facecolor('white')
-    tamaño_celda = 1
+def busqueda_ascenso_colina_paralela(cuadricula, inicio, meta, max_iteraciones, modo='restart', escaladores=None,
+                                     procesos=None, semilla=None, limite=None, **opciones):
+    # Muchos escaladores estocásticos a la vez en un grupo de procesos ('restart': reinicios aleatorios,
+    # 'annealing': recocido simulado). Gana el primero que llega a la meta y los demás se cancelan;
+    # 'limite' acota el tiempo total en segundos. Devuelve (camino, visitados), ([], []) si ninguno llegó.
+    return parallel_climbing(cuadricula, inicio, meta, max_iteraciones, modo, escaladores, procesos, semilla, limite, **opciones)
 
-    for i in range(len(cuadricula)):
-        for j in range(len(cuadricula[0])):
-            if cuadricula[i][j] == 1:
-                ax.add_patch(plt.Rectangle((j * tamaño_celda, i * tamaño_celda), tamaño_celda, tamaño_celda, color='black'))
-            elif cuadricula[i][j] == 0:
-                if meta:
-                    distancia = distancia_manhattan((i, j), meta)
-                    max_distancia = max(len(cuadricula), len(cuadricula[0]))  # Máxima distancia posible en la cuadrícula
-                    valor_calor = 1 - (distancia / max_distancia)  # Ajusta el valor entre 0 (frío) y 1 (caliente)
-                    color = plt.cm.viridis(valor_calor)  # Utiliza el mapa de colores viridis de Matplotlib
-                else:
-                    color = 'white'
 
-                ax.add_patch(plt.Rectangle((j * tamaño_celda, i * tamaño_celda), tamaño_celda, tamaño_celda, color=color))
+def busqueda_ascenso_colina_lote(cuadricula, inicios, metas, max_iteraciones, bloque_bytes=64 * 2 ** 20):
+    # Avanza a la vez muchos escaladores voraces (inicios: (K, 2); metas: (K, 2) o una sola meta) con la
+    # misma regla que busqueda_ascenso_colina. Devuelve (llegó, longitudes, offsets, celdas): la trayectoria
+    # del escalador i es celdas[offsets[i]:offsets[i + 1]].
+    return hill_climbing_batch(cuadricula, inicios, metas, max_iteraciones, bloque_bytes)
 
-    plt.scatter(inicio[1] * tamaño_celda + tamaño_celda / 2, inicio[0] * tamaño_celda + tamaño_celda / 2, color='orange', marker='o', s=100)
-    plt.scatter(meta[1] * tamaño_celda + tamaño_celda / 2, meta[0] * tamaño_celda + tamaño_celda / 2, color='red', marker='x', s=100)
-
-    if camino:
-        camino_x, camino_y = zip(*camino)
-        camino_x = [x * tamaño_celda + tamaño_celda / 2 for x in camino_x]
-        camino_y = [y * tamaño_celda + tamaño_celda / 2 for y in camino_y]
-        plt.plot(camino_y, camino_x, color='blue', label='Camino')
-
-    if visitados:
-        visitados_x, visitados_y = zip(*visitados)
-        visitados_x = [x * tamaño_celda + tamaño_celda / 2 for x in visitados_x]
-        visitados_y = [y * tamaño_celda + tamaño_celda / 2 for y in visitados_y]
-        for i, (x, y) in enumerate(zip(visitados_x, visitados_y), 1):
-            plt.text(y, x, str(i), ha='center', va='center', color='white', fontsize=14)
-
-    for i in range(len(cuadricula) + 1):
-        plt.axhline(y=i * tamaño_celda, color='black', linewidth=0.1)
-    for j in range(len(cuadricula[0]) + 1):
-        plt.axvline(x=j * tamaño_celda, color='black', linewidth=0.1)
-
-    plt.legend()
-    plt.show()
 
 def main():
     tamaño_cuadricula = 10
     cuadricula = inicializar_cuadricula(tamaño_cuadricula)
     num_obstaculos = (tamaño_cuadricula * tamaño_cuadricula) // 4
-    generar_obstaculos(cuadricula, num_obstaculos)
+    rng = make_rng()
+    generar_obstaculos(cuadricula, num_obstaculos, rng)
 
     try:
-        inicio, meta = generar_inicio_meta(cuadricula)
+        inicio, meta = generar_inicio_meta(cuadricula, rng)
     except ValueError as e:
         print(e)
         return
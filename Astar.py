@@ -1,127 +1,313 @@
-import matplotlib.pyplot as plt
-import numpy as np
-import random
-
-def initialize_grid(n):
-    return np.zeros((n, n), dtype=int)
-
-def is_valid(x, y, grid):
-    return 0 <= x < len(grid) and 0 <= y < len(grid[0]) and grid[x][y] == 0
-
-def genera_obstaculos(grid, n):
-    for _ in range(n):
-        x, y = random.randint(0, len(grid) - 1), random.randint(0, len(grid[0]) - 1)
-        while grid[x][y] == 1:
-            x, y = random.randint(0, len(grid) - 1), random.randint(0, len(grid[0]) - 1)
-        grid[x][y] = 1
-
-def genera_start_goal(grid):
-    empty_cells = [(x, y) for x in range(len(grid)) for y in range(len(grid[0])) if grid[x][y] == 0]
-    if len(empty_cells) < 2:
-        raise ValueError("La cuadrícula no tiene suficientes celdas libres para establecer el inicio y la meta.")
-    start, goal = random.sample(empty_cells, 2)
-    return start, goal
-
-def manhattan_distance(point1, point2):
-    return abs(point1[0] - point2[0]) + abs(point1[1] - point2[1])
-
-def a_star(grid, start, goal):
-    open_set = [start]
-    came_from = {}
-    g_score = {(cell[0], cell[1]): float('inf') for cell in np.ndindex(grid.shape)}
-    g_score[start] = 0
-
-    f_score = {(cell[0], cell[1]): float('inf') for cell in np.ndindex(grid.shape)}
-    f_score[start] = manhattan_distance(start, goal)
-
-    while open_set:
-        current = min(open_set, key=lambda cell: f_score[cell])
-
-        if current == goal:
-            path = reconstruct_path(came_from, current)
+from functools import partial
+import Grid_Renderer
+from Grid_Generator import make_rng, initialize_grid, genera_obstaculos, genera_start_goal, is_valid, manhattan_distance
+from Grid_Generator import STRAIGHT, DIAGONAL
+import heapq
+from Search_State import SearchState, INF
+from Distance_Field import UNREACHABLE
+
+draw_grid = partial(Grid_Renderer.draw_grid, style='a_star')
+
+# Nombres públicos del script; initialize_grid, is_valid, manhattan_distance y los generadores se
+# reexportan de Grid_Generator.
+__all__ = ['initialize_grid', 'is_valid', 'genera_obstaculos', 'genera_start_goal', 'manhattan_distance',
+           'HEURISTICS', 'TIE_BREAKS', 'a_star', 'bidirectional_a_star', 'jump_point_search', 'reconstruct_path',
+           'draw_grid', 'main']
+
+# Heurísticas para a_star en función de (dx, dy) hasta la meta y del costo de un paso recto y uno
+# diagonal. Con 4 vecinos una diagonal cuesta dos pasos rectos y 'octile' coincide con 'manhattan'.
+HEURISTICS = {
+    'manhattan': lambda dx, dy, straight, diagonal: straight * (dx + dy),
+    'octile': lambda dx, dy, straight, diagonal: straight * max(dx, dy) + (diagonal - straight) * min(dx, dy),
+    'chebyshev': lambda dx, dy, straight, diagonal: straight * max(dx, dy),
+}
+
+# Desempate entre entradas con el mismo f: (peso de g, peso del orden de inserción) en la clave secundaria.
+#   'fifo':   el primero que entró (el comportamiento original)
+#   'lifo':   el último que entró
+#   'high_g': el más avanzado (mayor g); en cuadrículas abiertas evita expandir toda la banda de empates
+#   'low_g':  el menos avanzado
+TIE_BREAKS = {'fifo': (0, 0), 'lifo': (0, -1), 'high_g': (-1, 0), 'low_g': (1, 0)}
+
+# Celdas que recorre como máximo un salto de jump_point_search.
+JUMP_LIMIT = 64
+
+def a_star(grid, start, goal, stats=None, components=None, field=None, connectivity=4, corner='none',
+           heuristic=None, tie_break='fifo'):
+    # Camino más corto con A*, o None si no hay.
+    #   connectivity: 4 (pasos de costo 1) u 8 (recto STRAIGHT, diagonal DIAGONAL; ver Grid_Generator)
+    #   corner:       regla para las diagonales junto a obstáculos ('allow', 'one' o 'none')
+    #   heuristic:    'manhattan', 'octile' o 'chebyshev'; por defecto manhattan con 4 vecinos y octile con 8
+    #   tie_break:    orden entre empates de f (ver TIE_BREAKS)
+    if connectivity not in (4, 8):
+        raise ValueError("La conectividad debe ser 4 u 8: " + str(connectivity))
+    if components is not None and not components.reachable(start, goal):
+        return None
+    straight, diagonal = (1, 2) if connectivity == 4 else (STRAIGHT, DIAGONAL)
+    estimate = HEURISTICS[heuristic or ('manhattan' if connectivity == 4 else 'octile')]
+    g_weight, counter_weight = TIE_BREAKS[tie_break]
+    # Con un campo de distancia a la meta (Distance_Field.goal_field) la heurística es la distancia
+    # exacta: solo se expanden celdas de caminos óptimos.
+    h = None
+    if field is not None:
+        if connectivity != 4:
+            raise ValueError("El campo de distancia solo sirve como heurística con 4 vecinos.")
+        if field[start[0], start[1]] == UNREACHABLE:
+            return None
+        h = field.ravel()  # Mismo id plano que SearchState: x * columnas + y
+
+    # Estado compacto: g, padres y cerrados en arreglos NumPy indexados por id de celda.
+    state = SearchState(grid, with_g=True)
+    start_id, goal_id = state.cell_id(start), state.cell_id(goal)
+    moves = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+    gx, gy = goal
+
+    # Montículo binario con (f, desempate, orden de inserción, id); las entradas obsoletas se descartan
+    # al sacarlas.
+    open_heap = [(estimate(abs(start[0] - gx), abs(start[1] - gy), straight, diagonal), 0, 0, start_id)]
+    counter = 1
+    state.g[start_id] = 1  # SearchState guarda g + 1 (0 = no alcanzada)
+
+    push, pop, neighbors = heapq.heappush, heapq.heappop, state.neighbors
+    straight_steps = None
+    if connectivity == 8:
+        # Primero los vecinos rectos y luego las diagonales; el costo de cada paso se deduce del salto de id.
+        straight_steps = {1, -1, state.cols, -state.cols}
+        neighbors = lambda cell_id, moves: state.neighbors(cell_id, moves) + state.diagonal_neighbors(cell_id, corner)
+    if stats is not None:  # Sin stats no se envuelve nada
+        push = stats.frontier_push(push, open_heap, lambda entry: state.coords(entry[3]))
+        pop = stats.frontier_pop(pop)
+        neighbors = stats.expansion(neighbors, state.coords)
+
+    while open_heap:
+        current = pop(open_heap)[3]
+
+        if state.visited[current]:
+            if stats is not None:
+                stats.reopened += 1
+            continue  # Entrada obsoleta (borrado perezoso)
+
+        if current == goal_id:
+            path = reconstruct_path(state, current)
             return path
 
-        open_set.remove(current)
-
-        for neighbor in [(current[0], current[1] + 1), (current[0], current[1] - 1), (current[0] + 1, current[1]), (current[0] - 1, current[1])]:
-            if is_valid(neighbor[0], neighbor[1], grid):
-                tentative_g_score = g_score[current] + 1
-
-                if tentative_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = g_score[neighbor] + manhattan_distance(neighbor, goal)
-
-                    if neighbor not in open_set:
-                        open_set.append(neighbor)
-
-    return None  # No se encontró un camino válido
-
-def reconstruct_path(came_from, current):
-    total_path = [current]
-    while current in came_from:
-        current = came_from[current]
-        total_path.insert(0, current)
-    return total_path
-
-
-def draw_grid(grid, start, goal, path, visited):
-    fig, ax = plt.subplots()
-
-    ax.set_facecolor('white')
-    cell_size = 1
-
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == 1:
-                ax.add_patch(plt.Rectangle((j * cell_size, i * cell_size), cell_size, cell_size, color='black'))
-            elif grid[i][j] == 0:
-                # Calcula el valor de calor en función de la distancia
-                if goal:
-                    distance = manhattan_distance((i, j), goal)
-                    max_heat = max(len(grid), len(grid[0]))  # Máxima distancia posible en la cuadrícula
-                    heat_value = 1 - (distance / max_heat)  # Ajusta el valor entre 0 (frío) y 1 (caliente)
-                    color = plt.cm.viridis(heat_value)  # Utiliza el mapa de colores viridis de Matplotlib
+        state.visited[current] = True
+        current_g = int(state.g[current]) - 1
+
+        for neighbor in neighbors(current, moves):
+            if straight_steps is None or neighbor - current in straight_steps:
+                tentative_g_score = current_g + straight
+            else:
+                tentative_g_score = current_g + diagonal
+            if tentative_g_score + 1 < (state.g[neighbor] or INF):
+                state.parent[neighbor] = current + 1
+                state.g[neighbor] = tentative_g_score + 1
+                if h is None:
+                    x, y = state.coords(neighbor)
+                    f_score = tentative_g_score + estimate(abs(x - gx), abs(y - gy), straight, diagonal)
                 else:
-                    color = 'white'
+                    f_score = tentative_g_score + int(h[neighbor])
+                push(open_heap, (f_score, g_weight * tentative_g_score + counter_weight * counter, counter, neighbor))
+                counter += 1
 
-                ax.add_patch(plt.Rectangle((j * cell_size, i * cell_size), cell_size, cell_size, color=color))
+    return None  # No se encontró un camino válido
 
-    plt.scatter(start[1] * cell_size + cell_size / 2, start[0] * cell_size + cell_size / 2, color='white', marker='o',
-                s=100)
-    plt.scatter(goal[1] * cell_size + cell_size / 2, goal[0] * cell_size + cell_size / 2, color='red', marker='x',
-                s=100)
+class _Frontiers:
+    # Varias listas abiertas vistas como una sola frontera para SearchStats.frontier_push: su tamaño es la suma.
+    def __init__(self, *heaps):
+        self.heaps = heaps
+
+    def __len__(self):
+        return sum(len(heap) for heap in self.heaps)
+
+def bidirectional_a_star(grid, start, goal, stats=None, components=None):
+    # A* desde el inicio (hacia la meta) y desde la meta (hacia el inicio) a la vez, ambos con
+    # manhattan_distance. Cada paso expande el lado con menos nodos abiertos; a igual f se prefiere
+    # el nodo con mayor g, para que cada lado avance hacia el otro en vez de llenar la banda de empates. 'best' es el costo
+    # del mejor camino encontrado al cruzarse ambos árboles. Se puede parar cuando el menor f de
+    # cualquiera de los lados es >= best: todo camino no visto cuesta al menos ese f, porque la
+    # heurística es admisible.
+    if components is not None and not components.reachable(start, goal):
+        return None
+
+    forward = SearchState(grid, with_g=True)
+    backward = SearchState(grid, with_g=True)
+    start_id, goal_id = forward.cell_id(start), forward.cell_id(goal)
+    moves = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+
+    forward.g[start_id] = 1  # g + 1, como en a_star
+    backward.g[goal_id] = 1
+    # Por lado: (estado, montículo de (f, -g, orden, id), objetivo de su heurística, estado del otro lado).
+    sides = [
+        (forward, [(manhattan_distance(start, goal), 0, 0, start_id)], goal, backward),
+        (backward, [(manhattan_distance(goal, start), 0, 1, goal_id)], start, forward),
+    ]
+    counter = 2
+    best, meeting = (0, start_id) if start_id == goal_id else (INF, -1)
+
+    push, pop = heapq.heappush, heapq.heappop
+    neighbors = {id(forward): forward.neighbors, id(backward): backward.neighbors}
+    if stats is not None:  # Sin stats no se envuelve nada
+        # La frontera medida son los dos montículos juntos.
+        push = stats.frontier_push(push, _Frontiers(sides[0][1], sides[1][1]), lambda entry: forward.coords(entry[3]))
+        pop = stats.frontier_pop(pop)
+        neighbors = {key: stats.expansion(function, forward.coords) for key, function in neighbors.items()}
+
+    while True:
+        # Descarta las entradas obsoletas de la cima de ambos montículos.
+        for state, heap, _, _ in sides:
+            while heap and state.visited[heap[0][3]]:
+                pop(heap)
+                if stats is not None:
+                    stats.reopened += 1
+        if not sides[0][1] or not sides[1][1]:
+            break
+        if max(sides[0][1][0][0], sides[1][1][0][0]) >= best:
+            break
+
+        state, heap, target, other = min(sides, key=lambda side: len(side[1]))
+        _, _, _, current = pop(heap)
+        state.visited[current] = True
+        tentative_g_score = int(state.g[current])  # g del vecino: (g[current] - 1) + 1
+
+        for neighbor in neighbors[id(state)](current, moves):
+            if tentative_g_score + 1 < (state.g[neighbor] or INF):
+                state.parent[neighbor] = current + 1
+                state.g[neighbor] = tentative_g_score + 1
+                f_score = tentative_g_score + manhattan_distance(state.coords(neighbor), target)
+                push(heap, (f_score, -tentative_g_score, counter, neighbor))
+                counter += 1
+            if other.g[neighbor]:
+                total = int(state.g[neighbor]) + int(other.g[neighbor]) - 2
+                if total < best:
+                    best, meeting = total, neighbor
+
+    if meeting == -1:
+        return None  # No se encontró un camino válido
+
+    # Inicio -> encuentro por el árbol de avance y encuentro -> meta por el árbol de retroceso.
+    path = forward.path_to(meeting)
+    path += backward.path_to(meeting)[::-1][1:]
+    return path
+
+def jump_point_search(grid, start, goal, stats=None, components=None):
+    # Jump Point Search para la cuadrícula 4-conexa de costo uniforme.
+    # Orden canónico: ante caminos equivalentes se prefiere moverse en vertical antes que en horizontal.
+    #   - Tras un paso vertical los sucesores naturales son seguir recto, izquierda y derecha.
+    #   - Tras un paso horizontal solo se sigue recto; arriba/abajo son vecinos forzados cuando la
+    #     celda de arriba/abajo está libre pero la que queda detrás de ella está bloqueada.
+    # En lugar de insertar cada vecino se "salta" en línea recta hasta la meta, un obstáculo o un
+    # punto de salto (celda con vecinos forzados). A* solo trabaja sobre los puntos de salto.
+    # Un salto avanza a lo sumo JUMP_LIMIT celdas y la última se trata como punto de salto: sin tope, en una
+    # cuadrícula abierta cada celda de un salto vertical revisaría su fila completa. Un punto de salto de más
+    # solo agrega un nodo a la lista abierta; la longitud del camino no cambia.
+    if components is not None and not components.reachable(start, goal):
+        return None
+
+    # Estado perezoso como en a_star (g + 1, padre + 1 y cerrados); la cuadrícula se lee sin copiarla.
+    state = SearchState(grid, with_g=True)
+    cells = memoryview(state.cells)  # Índices que devuelven enteros de Python, no escalares de NumPy
+    cols, size = state.cols, state.size
+    to_cell = state.coords
+    start_id, goal_id = state.cell_id(start), state.cell_id(goal)
+
+    def jump_horizontal(cell, step):
+        y = cell % cols
+        for _ in range(JUMP_LIMIT):
+            y += step
+            if y < 0 or y >= cols:
+                return -1
+            cell += step
+            if cells[cell]:
+                return -1
+            if cell == goal_id:
+                return cell
+            if (cell >= cols and not cells[cell - cols] and cells[cell - cols - step]) or \
+                    (cell < size - cols and not cells[cell + cols] and cells[cell + cols - step]):
+                return cell
+        return cell
+
+    def jump_vertical(cell, step):
+        for _ in range(JUMP_LIMIT):
+            cell += step
+            if cell < 0 or cell >= size or cells[cell]:
+                return -1
+            if cell == goal_id:
+                return cell
+            if jump_horizontal(cell, 1) != -1 or jump_horizontal(cell, -1) != -1:
+                return cell
+        return cell
+
+    def successors(cell):
+        came_from = int(state.parent[cell]) - 1
+        if came_from == -1:
+            jumps = [jump_vertical(cell, -cols), jump_vertical(cell, cols), jump_horizontal(cell, -1), jump_horizontal(cell, 1)]
+        elif abs(cell - came_from) >= cols:
+            step = cols if cell > came_from else -cols
+            jumps = [jump_vertical(cell, step), jump_horizontal(cell, 1), jump_horizontal(cell, -1)]
+        else:
+            step = 1 if cell > came_from else -1
+            jumps = [jump_horizontal(cell, step)]
+            for side in (-cols, cols):
+                if 0 <= cell + side < size and not cells[cell + side] and cells[cell + side - step]:
+                    jumps.append(jump_vertical(cell, side))
+        return [jump for jump in jumps if jump != -1]
+
+    # Montículo de (f, -g, orden, id): a igual f se prefiere el punto de salto más avanzado.
+    open_heap = [(manhattan_distance(start, goal), 0, 0, start_id)]
+    counter = 1
+    state.g[start_id] = 1
+
+    push, pop, expand = heapq.heappush, heapq.heappop, successors
+    if stats is not None:  # Sin stats no se envuelve nada
+        push = stats.frontier_push(push, open_heap, lambda entry: to_cell(entry[3]))
+        pop = stats.frontier_pop(pop)
+        expand = stats.expansion(expand, to_cell)
+
+    while open_heap:
+        _, _, _, current = pop(open_heap)
+
+        if state.visited[current]:
+            if stats is not None:
+                stats.reopened += 1
+            continue
+
+        if current == goal_id:
+            # Une los puntos de salto con los tramos rectos que hay entre ellos.
+            jump_points = state.path_ids(current).tolist()
+            path = [start]
+            for a, b in zip(jump_points, jump_points[1:]):
+                step = (cols if b > a else -cols) if abs(b - a) >= cols else (1 if b > a else -1)
+                path.extend(to_cell(cell) for cell in range(a + step, b + step, step))
+            return path
 
-    if path:
-        path_x, path_y = zip(*path)
-        path_x = [x * cell_size + cell_size / 2 for x in path_x]
-        path_y = [y * cell_size + cell_size / 2 for y in path_y]
-        plt.plot(path_y, path_x, color='white', label='Camino')
+        state.visited[current] = True
+        current_g = int(state.g[current]) - 1
 
-    if visited:
-        visited_x, visited_y = zip(*visited)
-        visited_x = [x * cell_size + cell_size / 2 for x in visited_x]
-        visited_y = [y * cell_size + cell_size / 2 for y in visited_y]
-        for i, (x, y) in enumerate(zip(visited_x, visited_y), 1):
-            plt.text(y, x, str(i), ha='center', va='center', color='white', fontsize=14)
+        for jump in expand(current):
+            distance = abs(jump - current)
+            tentative_g_score = current_g + (distance // cols if distance >= cols else distance)
+            if tentative_g_score + 1 < (state.g[jump] or INF):
+                state.parent[jump] = current + 1
+                state.g[jump] = tentative_g_score + 1
+                push(open_heap, (tentative_g_score + manhattan_distance(to_cell(jump), goal), -tentative_g_score, counter, jump))
+                counter += 1
 
-    for i in range(len(grid) + 1):
-        plt.axhline(y=i * cell_size, color='black', linewidth=0.1)
-    for j in range(len(grid[0]) + 1):
-        plt.axvline(x=j * cell_size, color='black', linewidth=0.1)
+    return None  # No se encontró un camino válido
 
-    plt.legend()
-    plt.show()
+def reconstruct_path(state, current):
+    return state.path_to(current)
 
 
 def main():
     n = 10
     grid = initialize_grid(n)
     num_obstacles = (n * n) // 4
-    genera_obstaculos(grid, num_obstacles)
+    rng = make_rng()
+    genera_obstaculos(grid, num_obstacles, rng)
 
     try:
-        start, goal = genera_start_goal(grid)
+        start, goal = genera_start_goal(grid, rng)
     except ValueError as e:
         print(e)
         return
@@ -0,0 +1,189 @@
+import numpy as np
+import time
+from Grid_Renderer import draw_grid
+from Grid_Generator import make_rng, initialize_grid, genera_obstaculos, genera_start_goal
+from Path_Codec import ids_to_cells, path_tuples
+from Search_State import SearchState, lazy_zeros
+
+def _layer_neighbors(frontier, cells, visited, shifts, cols):
+    # Todos los vecinos de la capa a la vez: (k, 4) -> k*4 candidatos, sin salir de la cuadrícula, sin
+    # obstáculos ni visitados. Los bordes se revisan con la posición de cada celda en lugar de rodear la
+    # cuadrícula con una copia con borde, así que solo se leen las celdas de la frontera.
+    column = frontier % cols
+    inside = np.stack((frontier >= cols, frontier < cells.size - cols, column > 0, column < cols - 1), axis=1)
+    candidates = (frontier[:, None] + shifts)[inside]
+    sources = np.broadcast_to(frontier[:, None], inside.shape)[inside]
+    keep = (cells[candidates] == 0) & ~visited[candidates]
+    return candidates[keep], sources[keep]
+
+def _drop_repeats(candidates, sources, slot):
+    # Si una celda aparece varias veces, gana la última escritura; se queda una sola copia.
+    # 'slot' puede traer valores viejos: cada celda se escribe antes de leerse.
+    index = np.arange(candidates.size, dtype=np.int32)
+    slot[candidates] = index
+    unique = slot[candidates] == index
+    return candidates[unique], sources[unique]
+
+def _to_cells(ids, cols):
+    return list(zip((ids // cols).tolist(), (ids % cols).tolist()))
+
+def bfs(grid, start, goal, stats=None, components=None):
+    # Búsqueda en anchura que expande toda la frontera de una capa a la vez con operaciones de NumPy.
+    # Los visitados y los padres (id + 1) son los arreglos perezosos de Search_State: una consulta corta
+    # solo toca las páginas de las celdas que alcanza.
+    if components is not None and not components.reachable(start, goal):
+        return [], []
+    state = SearchState(np.asarray(grid))
+    cols = state.cols
+    start_id, goal_id = state.cell_id(start), state.cell_id(goal)
+
+    visited, parent = state.visited, state.parent
+    slot = lazy_zeros(state.size, np.int32)  # Para descartar repetidos dentro de una misma capa
+    # Movimientos: izquierda, derecha, abajo, arriba (misma prioridad que dfs).
+    shifts = np.array([-cols, cols, -1, 1])
+
+    visited[start_id] = True
+    frontier = np.array([start_id], dtype=np.int64)
+    layers = []  # Capas expandidas, en orden
+
+    # Las estadísticas se actualizan una vez por capa, no por nodo.
+    clock = time.perf_counter if stats is not None and stats.timing else None
+
+    while frontier.size and not visited[goal_id]:
+        layers.append(frontier)
+        if clock:
+            started = clock()
+
+        candidates, sources = _layer_neighbors(frontier, state.cells, visited, shifts, cols)
+        if clock:
+            stats.neighbor_time += clock() - started
+            started = clock()
+
+        candidates, sources = _drop_repeats(candidates, sources, slot)
+        visited[candidates] = True
+        parent[candidates] = sources + 1
+        if stats is not None:
+            if clock:
+                stats.open_set_time += clock() - started
+            _record_layer(stats, frontier, candidates, cols)
+        frontier = candidates
+
+    expanded = np.concatenate(layers) if layers else np.empty(0, dtype=np.int64)
+    visited_list = _to_cells(expanded, cols)
+
+    if not visited[goal_id]:
+        return visited_list, []  # La meta no es alcanzable desde el inicio
+
+    # Reconstruye la trayectoria siguiendo los padres desde la meta.
+    path = state.path_to(goal_id)
+
+    return visited_list, path
+
+
+def bidirectional_bfs(grid, start, goal, stats=None, components=None):
+    # BFS desde el inicio y desde la meta a la vez; en cada paso se expande la capa completa del
+    # lado con la frontera más pequeña. Como cada capa se expande entera, la primera capa que toca
+    # celdas del otro lado contiene un punto de encuentro óptimo: el de menor distancia desde el otro lado.
+    if components is not None and not components.reachable(start, goal):
+        return [], []
+    grid = np.asarray(grid)
+    cols = grid.shape[1]
+    start_id, goal_id = start[0] * cols + start[1], goal[0] * cols + goal[1]
+    shifts = np.array([-cols, cols, -1, 1])
+
+    # Por lado: un SearchState perezoso (visitados, padres + 1 y distancia + 1 en g), frontera y raíz.
+    sides = []
+    for root in (start_id, goal_id):
+        state = SearchState(grid, with_g=True)
+        state.visited[root] = True
+        state.g[root] = 1
+        sides.append({'state': state, 'frontier': np.array([root], dtype=np.int64), 'depth': 0, 'root': root})
+    cells = sides[0]['state'].cells
+    slot = lazy_zeros(cells.size, np.int32)
+
+    layers = []
+    meeting = start_id if start_id == goal_id else -1
+    # Las estadísticas se actualizan una vez por capa, como en bfs.
+    clock = time.perf_counter if stats is not None and stats.timing else None
+
+    while meeting == -1 and sides[0]['frontier'].size and sides[1]['frontier'].size:
+        side, other = (sides[0], sides[1]) if sides[0]['frontier'].size <= sides[1]['frontier'].size else (sides[1], sides[0])
+        frontier = side['frontier']
+        state = side['state']
+        layers.append(frontier)
+        if clock:
+            started = clock()
+
+        candidates, sources = _layer_neighbors(frontier, cells, state.visited, shifts, cols)
+        if clock:
+            stats.neighbor_time += clock() - started
+            started = clock()
+
+        candidates, sources = _drop_repeats(candidates, sources, slot)
+        side['depth'] += 1
+        state.visited[candidates] = True
+        state.g[candidates] = side['depth'] + 1
+        state.parent[candidates] = sources + 1
+        side['frontier'] = candidates
+        if stats is not None:
+            if clock:
+                stats.open_set_time += clock() - started
+            _record_layer(stats, frontier, candidates, cols)
+
+        reached = other['state'].g[candidates]
+        touching = reached > 0
+        if touching.any():
+            meeting = int(candidates[touching][np.argmin(reached[touching])])
+
+    expanded = np.concatenate(layers) if layers else np.empty(0, dtype=np.int64)
+    visited_list = _to_cells(expanded, cols)
+
+    if meeting == -1:
+        return visited_list, []  # La meta no es alcanzable desde el inicio
+
+    # Inicio -> encuentro con los padres del lado del inicio, y encuentro -> meta con los del otro.
+    ids = np.concatenate((sides[0]['state'].path_ids(meeting), sides[1]['state'].path_ids(meeting)[::-1][1:]))
+    path = path_tuples(ids_to_cells(ids, cols))
+
+    return visited_list, path
+
+
+def _record_layer(stats, expanded, generated, cols):
+    # Suma una capa de BFS a las estadísticas; los ganchos reciben cada celda como (x, y).
+    stats.expanded += expanded.size
+    stats.generated += generated.size
+    stats.peak_frontier = max(stats.peak_frontier, expanded.size, generated.size)
+    if stats.on_expand:
+        for cell_id in expanded.tolist():
+            stats.on_expand(divmod(cell_id, cols))
+    if stats.on_generate:
+        for cell_id in generated.tolist():
+            stats.on_generate(divmod(cell_id, cols))
+
+
+def main():
+    n = 10 # Tamaño de la cuadrícula (NxN)
+    grid = initialize_grid(n)
+
+    # Genera obstáculos aleatorios (N^2/4 obstáculos)
+    num_obstacles = (n*n) // 4
+    rng = make_rng()
+    genera_obstaculos(grid, num_obstacles, rng)
+
+    try:
+        start, goal = genera_start_goal(grid, rng)
+    except ValueError as e:
+        print(e)
+        return
+
+    visited, path = bfs(grid, start, goal)
+    if path:
+        print("Camino encontrado:", path)
+        print("Camino recorrido:", visited)
+    else:
+        print("No se encontró un camino válido.")
+
+    draw_grid(grid, start, goal, path, visited)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from Astar import a_star, bidirectional_a_star, jump_point_search
+from BFS import bfs, bidirectional_bfs
+from DFS import dfs
+from Components import ComponentIndex
+from Distance_Field import goal_field, descend
+
+
+# Cada motor devuelve solo el camino (lista de tuplas, vacía o None si no hay). Todos consultan
+# primero el índice de componentes (ver Components.ComponentIndex).
+# 'distance_field' guarda en la caché LRU de cada proceso un campo por meta: las consultas que
+# repiten meta solo bajan por el campo ya calculado.
+ENGINES = {
+    'a_star': lambda grid, start, goal, components: a_star(grid, start, goal, None, components),
+    'bfs': lambda grid, start, goal, components: bfs(grid, start, goal, None, components)[1],
+    'bidirectional_a_star': lambda grid, start, goal, components: bidirectional_a_star(grid, start, goal, None, components),
+    'bidirectional_bfs': lambda grid, start, goal, components: bidirectional_bfs(grid, start, goal, None, components)[1],
+    'dfs': lambda grid, start, goal, components: dfs(grid, start, goal, None, components)[1],
+    'distance_field': lambda grid, start, goal, components: descend(goal_field(grid, goal), start) if components.reachable(start, goal) else [],
+    'jump_point_search': lambda grid, start, goal, components: jump_point_search(grid, start, goal, None, components),
+}
+
+# Cuadrícula e índice de componentes compartidos del proceso trabajador (se asignan en _attach).
+_shared = {}
+
+
+def _attach(grid_spec, labels_spec):
+    # Inicializador de cada trabajador: abre la memoria compartida y crea vistas sin copiarla.
+    # Cada spec es (nombre, forma, dtype).
+    views = []
+    for name, shape, dtype in (grid_spec, labels_spec):
+        shm = shared_memory.SharedMemory(name=name)
+        _shared.setdefault('shm', []).append(shm)
+        views.append(np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+    _shared['grid'] = views[0]
+    _shared['components'] = ComponentIndex(labels=views[1])
+
+
+def _share(array):
+    # Copia un arreglo a un bloque nuevo de memoria compartida; devuelve (bloque, spec).
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype)
+
+
+def _solve_chunk(engine, queries, grid=None, components=None):
+    # Resuelve un bloque de consultas (k, 4) y devuelve (longitudes, celdas concatenadas).
+    if grid is None:
+        grid, components = _shared['grid'], _shared['components']
+    solve = ENGINES[engine]
+    lengths = np.full(len(queries), -1, dtype=np.int32)
+    paths = []
+    for i, (sx, sy, gx, gy) in enumerate(queries.tolist()):
+        path = solve(grid, (sx, sy), (gx, gy), components)
+        if path:
+            lengths[i] = len(path)
+            paths.append(np.asarray(path, dtype=np.int32).reshape(-1, 2))
+    cells = np.concatenate(paths) if paths else np.empty((0, 2), dtype=np.int32)
+    return lengths, cells
+
+
+def solve_batch(grid, queries, engine='a_star', workers=None, chunk_size=None):
+    # Resuelve muchas consultas (inicio, meta) sobre la misma cuadrícula repartiéndolas entre procesos.
+    #   queries: arreglo (Q, 4) con filas (inicio_x, inicio_y, meta_x, meta_y), o lista de pares (inicio, meta).
+    # La cuadrícula y su índice de componentes se copian una sola vez a memoria compartida; los
+    # trabajadores los leen sin recibirlos por pickle.
+    # Devuelve (longitudes, offsets, celdas):
+    #   longitudes[i] es el número de celdas del camino i (-1 si no se encontró),
+    #   celdas[offsets[i]:offsets[i + 1]] son sus coordenadas (int32, forma (L, 2)).
+    if engine not in ENGINES:
+        raise ValueError("Motor desconocido: " + str(engine))
+    queries = np.asarray(queries, dtype=np.int64).reshape(-1, 4)
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(queries) // (workers * 4)))
+    chunks = [queries[i:i + chunk_size] for i in range(0, len(queries), chunk_size)]
+
+    components = ComponentIndex(grid)
+    if workers == 1 or len(chunks) <= 1:
+        results = [_solve_chunk(engine, chunk, grid, components) for chunk in chunks]
+    else:
+        blocks = []
+        try:
+            grid_shm, grid_spec = _share(np.ascontiguousarray(grid, dtype=np.uint8))
+            blocks.append(grid_shm)
+            labels_shm, labels_spec = _share(components.labels)
+            blocks.append(labels_shm)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                     initargs=(grid_spec, labels_spec)) as pool:
+                results = list(pool.map(_solve_chunk, [engine] * len(chunks), chunks))
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+    lengths = np.concatenate([r[0] for r in results]) if results else np.empty(0, dtype=np.int32)
+    cells = np.concatenate([r[1] for r in results]) if results else np.empty((0, 2), dtype=np.int32)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(np.maximum(lengths, 0), out=offsets[1:])
+    return lengths, offsets, cells
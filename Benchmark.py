@@ -0,0 +1,172 @@
+import argparse
+import csv
+import json
+import sys
+import time
+import tracemalloc
+
+from Grid_Generator import generate_scenario
+from Search_Stats import SearchStats
+from Astar import a_star, bidirectional_a_star, jump_point_search
+from BFS import bfs, bidirectional_bfs
+from DFS import dfs
+from Hill_Climbing import hill_climbing_path
+
+SIZES = [10, 64, 256, 1024, 4096]
+DENSITIES = [0.0, 0.15, 0.30, 0.45]
+
+FIELDS = ['engine', 'size', 'density', 'seed', 'time', 'expanded', 'generated', 'peak_frontier', 'reopened',
+          'peak_memory', 'path_length', 'found']
+
+
+def _run_a_star(grid, start, goal, stats):
+    return a_star(grid, start, goal, stats)
+
+def _run_bfs(grid, start, goal, stats):
+    return bfs(grid, start, goal, stats)[1]
+
+def _run_bidirectional_a_star(grid, start, goal, stats):
+    return bidirectional_a_star(grid, start, goal, stats)
+
+def _run_bidirectional_bfs(grid, start, goal, stats):
+    return bidirectional_bfs(grid, start, goal, stats)[1]
+
+def _run_dfs(grid, start, goal, stats):
+    return dfs(grid, start, goal, stats)[1]
+
+def _run_jump_point_search(grid, start, goal, stats):
+    return jump_point_search(grid, start, goal, stats)
+
+def _run_hill_climbing(grid, start, goal, stats):
+    # A lo sumo N^2/4 pasos, como main, y se corta al quedarse sin movimientos (cuenta como no encontrado).
+    return hill_climbing_path(grid, start, goal, stats=stats)
+
+
+ENGINES = {
+    'a_star': _run_a_star,
+    'bfs': _run_bfs,
+    'bidirectional_a_star': _run_bidirectional_a_star,
+    'bidirectional_bfs': _run_bidirectional_bfs,
+    'dfs': _run_dfs,
+    'hill_climbing': _run_hill_climbing,
+    'jump_point_search': _run_jump_point_search,
+}
+
+
+def run_case(engine, size, density, seed, memory=True, repeat=1):
+    # Ejecuta un motor sobre un escenario con semilla y devuelve una fila de resultados.
+    # El tiempo reportado es el mejor de 'repeat' ejecuciones.
+    grid, start, goal = generate_scenario(size, density, seed)
+    run = ENGINES[engine]
+
+    elapsed = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        path = run(grid, start, goal, None)
+        elapsed = min(elapsed, time.perf_counter() - started)
+
+    # Ejecución aparte con contadores (y con tracemalloc si se pide memoria) para no alterar el tiempo.
+    stats = SearchStats()
+    peak = None
+    if memory:
+        tracemalloc.start()
+    run(grid, start, goal, stats)
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    found = bool(path) and tuple(path[-1]) == tuple(goal)
+    return {
+        'engine': engine,
+        'size': size,
+        'density': density,
+        'seed': seed,
+        'time': elapsed,
+        'expanded': stats.expanded,
+        'generated': stats.generated,
+        'peak_frontier': stats.peak_frontier,
+        'reopened': stats.reopened,
+        'peak_memory': peak,
+        'path_length': len(path) if found else None,
+        'found': found,
+    }
+
+
+def run_matrix(engines, sizes, densities, seeds, memory=True, repeat=1, log=None):
+    results = []
+    for size in sizes:
+        for density in densities:
+            for seed in seeds:
+                for engine in engines:
+                    row = run_case(engine, size, density, seed, memory, repeat)
+                    results.append(row)
+                    if log:
+                        print("{engine:>20} n={size:<5} d={density:.2f} seed={seed} "
+                              "t={time:.4f}s expandidos={expanded} camino={path_length}".format(**row), file=log)
+    return results
+
+
+def write_json(results, path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=1)
+
+def write_csv(results, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def compare(results, baseline, threshold, min_time=0.01):
+    # Compara el tiempo de cada caso contra una corrida previa (JSON de este mismo script).
+    # Devuelve la lista de casos cuyo tiempo supera baseline * threshold. Los casos más rápidos
+    # que 'min_time' en ambas corridas se ignoran: a esa escala el ruido domina la medición.
+    key = lambda row: (row['engine'], row['size'], row['density'], row['seed'])
+    reference = {key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = reference.get(key(row))
+        if old is None or max(old['time'], row['time']) < min_time:
+            continue
+        if row['time'] > old['time'] * threshold:
+            regressions.append((row, old))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide el desempeño de los motores de búsqueda en cuadrículas con semilla.")
+    parser.add_argument('--engines', nargs='+', default=sorted(ENGINES), choices=sorted(ENGINES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--densities', nargs='+', type=float, default=DENSITIES)
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0])
+    parser.add_argument('--repeat', type=int, default=3, help="Ejecuciones por caso; se reporta el mejor tiempo.")
+    parser.add_argument('--no-memory', action='store_true', help="No medir el pico de memoria (evita la segunda ejecución).")
+    parser.add_argument('--json', help="Archivo JSON de salida.")
+    parser.add_argument('--csv', help="Archivo CSV de salida.")
+    parser.add_argument('--baseline', help="JSON de una corrida anterior para detectar regresiones.")
+    parser.add_argument('--threshold', type=float, default=1.25, help="Factor de tiempo permitido contra la línea base.")
+    parser.add_argument('--min-time', type=float, default=0.01, help="Tiempo mínimo (s) para comparar un caso.")
+    args = parser.parse_args(argv)
+
+    results = run_matrix(args.engines, args.sizes, args.densities, args.seeds, not args.no_memory,
+                         args.repeat, log=sys.stderr)
+
+    if args.json:
+        write_json(results, args.json)
+    if args.csv:
+        write_csv(results, args.csv)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_time)
+        for row, old in regressions:
+            print("Regresión: {} n={} d={:.2f} seed={}: {:.4f}s contra {:.4f}s".format(
+                row['engine'], row['size'], row['density'], row['seed'], row['time'], old['time']))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+import numpy as np
+
+# Celdas por bloque al numerar los tramos en label_components.
+CUMSUM_BLOCK = 1 << 20
+
+
+def label_components(grid):
+    # Etiqueta las componentes conexas (4-conexas) de celdas libres con una unión-búsqueda vectorizada.
+    # Devuelve un arreglo con la forma de la cuadrícula (int32, o int64 si tiene 2^31 celdas o más): -1 en
+    # obstáculos y, en cada celda libre, un entero >= 0 que es igual para todas las celdas de la misma componente.
+    # Los arreglos del tamaño de la cuadrícula son máscaras de 1 byte o del tipo de las etiquetas, y se liberan
+    # en cuanto dejan de hacer falta.
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    index = np.int32 if rows * cols < 2 ** 31 else np.int64
+    free = grid == 0
+    flat_free = free.ravel()
+
+    # Primero se agrupan los tramos horizontales de celdas libres: cada tramo es un solo nodo.
+    # 'run' es el tramo de cada celda (válido si está libre). np.cumsum de un bool pasa por una copia
+    # convertida al tipo de salida: por bloques de filas esa copia no crece con la cuadrícula.
+    starts = free.copy()
+    starts[:, 1:] &= ~free[:, :-1]
+    starts = starts.ravel()
+    run = np.empty(rows * cols, dtype=index)
+    runs = 0
+    block = max(1, CUMSUM_BLOCK // max(cols, 1)) * max(cols, 1)
+    for begin in range(0, run.size, block):
+        part = run[begin:begin + block]
+        np.cumsum(starts[begin:begin + block], dtype=index, out=part)
+        part += runs - 1
+        runs = int(part[-1]) + 1
+    del starts
+
+    # Aristas entre tramos: pares de celdas libres una encima de la otra. De cada racha de pares
+    # consecutivos basta el primero: todos unen el mismo par de tramos.
+    down = free[:-1] & free[1:]
+    down[:, 1:] &= ~(free[:-1, :-1] & free[1:, :-1])
+    down = down.ravel()
+    u = run[:down.size][down]
+    v = run[cols:][down]
+    del down
+
+    # Cada ronda engancha cada raíz a la menor de todas las raíces vecinas (np.minimum.at: con una
+    # asignación simple, una raíz con muchas aristas solo se uniría por una de ellas y un peine necesitaría
+    # una ronda por diente) y luego comprime los caminos hasta que todo nodo apunta a su raíz. Las aristas
+    # ya resueltas se descartan; bastan pocas rondas.
+    parent = np.arange(runs, dtype=index)
+    while u.size:
+        pu, pv = parent[u], parent[v]
+        pending = pu != pv
+        if not pending.all():
+            u, v = u[pending], v[pending]
+            pu, pv = pu[pending], pv[pending]
+        del pending
+        if not u.size:
+            break
+        low = np.minimum(pu, pv)
+        np.maximum(pu, pv, out=pu)
+        del pv
+        np.minimum.at(parent, pu, low)
+        del pu, low
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    del u, v
+
+    # Las etiquetas se escriben sobre 'run' para no reservar otro arreglo del tamaño de la cuadrícula; también
+    # por bloques, porque np.take convierte los índices a int64.
+    labels = run
+    for begin in range(0, run.size, block) if runs else ():
+        part = labels[begin:begin + block]
+        np.take(parent, part, out=part, mode='clip')
+    np.copyto(labels, -1, where=~flat_free)
+    return labels.reshape(rows, cols)
+
+
+class ComponentIndex:
+    # Índice de componentes conexas precalculado para una cuadrícula.
+    # reachable(inicio, meta) responde en O(1) si existe algún camino entre ambas celdas.
+    # Los motores que aceptan 'components' lo consultan antes de buscar: una meta inalcanzable se responde
+    # en O(1), sin recorrer la componente del inicio ni vaciar la lista abierta.
+
+    def __init__(self, grid=None, labels=None):
+        self.labels = label_components(grid) if labels is None else labels
+
+    def reachable(self, start, goal):
+        label = self.labels[start[0], start[1]]
+        return label != -1 and label == self.labels[goal[0], goal[1]]
+
+    def size(self, cell):
+        # Número de celdas libres en la componente de 'cell' (0 si es un obstáculo).
+        label = self.labels[cell[0], cell[1]]
+        return 0 if label == -1 else int(np.count_nonzero(self.labels == label))
@@ -0,0 +1,153 @@
+import heapq
+from Search_State import INF
+from Grid_Generator import padded_free
+
+
+class DStarLite:
+    # Replanificación incremental (D* Lite, la variante de LPA* con inicio móvil) sobre la cuadrícula 4-conexa.
+    # La búsqueda va de la meta hacia el inicio y guarda g y rhs de cada celda; cuando aparecen o
+    # desaparecen obstáculos solo se reparan las celdas cuyo costo cambió, en vez de repetir a_star.
+    #   planner = DStarLite(grid, start, goal)
+    #   path = planner.plan()                          # Primera búsqueda (como a_star)
+    #   path = planner.edit(added=[(3, 4)])            # Pone obstáculos en 'grid' y repara el camino
+    #   path = planner.edit(removed=[(3, 4)])          # Quita obstáculos
+    #   path = planner.move_start((1, 2))              # El agente avanzó: nuevo inicio
+    # Los caminos son listas de tuplas (x, y) desde el inicio hasta la meta, o None si no hay.
+    # 'grid' se modifica en su lugar con cada edit.
+
+    def __init__(self, grid, start, goal, stats=None):
+        self.grid = grid
+        # Máscara plana rodeada por un borde de obstáculos (Grid_Generator.padded_free), en un bytearray.
+        free, width = padded_free(grid)
+        self.width = width
+        self.free = bytearray(free.tobytes())
+        self.g = [INF] * len(self.free)
+        self.rhs = [INF] * len(self.free)
+        self.shifts = (1, -1, width, -width)  # Misma prioridad de movimientos que a_star
+        self.start = self.last = self._id(start)
+        self.start_xy = divmod(self.start, width)
+        self.goal = self._id(goal)
+        self.km = 0  # Corrección de las claves cuando el inicio se mueve
+
+        # Montículo con (k1, k2, id) y la clave vigente de cada celda abierta; las entradas cuya clave
+        # ya no coincide se descartan al sacarlas (borrado perezoso, como en a_star).
+        self.open_heap = []
+        self.open_key = {}
+        self.stats = stats
+        self._push, self._pop, self._expand = heapq.heappush, heapq.heappop, self._neighbors
+        if stats is not None:
+            self._push = stats.frontier_push(self._push, self.open_heap, lambda entry: self._cell(entry[2]))
+            self._pop = stats.frontier_pop(self._pop)
+            self._expand = stats.expansion(self._expand, self._cell)
+
+        self._update(self.goal)
+
+    def _id(self, cell):
+        return (cell[0] + 1) * self.width + cell[1] + 1
+
+    def _cell(self, cell_id):
+        x, y = divmod(cell_id, self.width)
+        return x - 1, y - 1
+
+    def _neighbors(self, cell_id):
+        free = self.free
+        return [cell_id + shift for shift in self.shifts if free[cell_id + shift]]
+
+    def _key(self, cell_id):
+        best = min(self.g[cell_id], self.rhs[cell_id])
+        sx, sy = self.start_xy
+        x, y = divmod(cell_id, self.width)
+        return best + abs(sx - x) + abs(sy - y) + self.km, best
+
+    def _update(self, cell_id):
+        # Recalcula rhs (1 + el mejor g entre los vecinos) y abre la celda si quedó inconsistente.
+        g, rhs, free = self.g, self.rhs, self.free
+        if not free[cell_id]:
+            rhs[cell_id] = INF
+        elif cell_id == self.goal:
+            rhs[cell_id] = 0
+        else:
+            best = INF
+            for shift in self.shifts:
+                neighbor = cell_id + shift
+                if free[neighbor] and g[neighbor] < best:
+                    best = g[neighbor]
+            rhs[cell_id] = best + 1 if best < INF else INF
+        if g[cell_id] != rhs[cell_id]:
+            key = self._key(cell_id)
+            self.open_key[cell_id] = key
+            self._push(self.open_heap, (key[0], key[1], cell_id))
+        else:
+            self.open_key.pop(cell_id, None)
+
+    def _compute(self):
+        g, rhs, open_heap, open_key = self.g, self.rhs, self.open_heap, self.open_key
+        start = self.start
+        while open_heap:
+            k1, k2, current = open_heap[0]
+            if open_key.get(current) != (k1, k2):
+                self._pop(open_heap)  # Entrada obsoleta
+                if self.stats is not None:
+                    self.stats.reopened += 1
+                continue
+            # Clave del inicio (su heurística es 0): se termina cuando ya es consistente y nada la supera.
+            best = min(g[start], rhs[start])
+            if (k1, k2) >= (best + self.km, best) and rhs[start] == g[start]:
+                break
+            self._pop(open_heap)
+
+            key = self._key(current)
+            if (k1, k2) < key:
+                # La clave quedó vieja porque el inicio se movió: se reinserta con la actual.
+                open_key[current] = key
+                self._push(open_heap, (key[0], key[1], current))
+                continue
+
+            del open_key[current]
+            neighbors = self._expand(current)
+            if g[current] > rhs[current]:
+                g[current] = rhs[current]  # Sobreconsistente: se fija su g
+            else:
+                g[current] = INF  # Subconsistente: se invalida y se recalcula
+                self._update(current)
+            for neighbor in neighbors:
+                self._update(neighbor)
+
+    def plan(self):
+        # Repara la búsqueda (si hace falta) y devuelve el camino del inicio a la meta.
+        self._compute()
+        g, current = self.g, self.start
+        if not self.free[current] or g[current] >= INF:
+            return None  # No se encontró un camino válido
+        path = [self._cell(current)]
+        while current != self.goal:
+            # Siguiente celda: el vecino con menor g (los empates siguen el orden de movimientos).
+            current = min(self._neighbors(current), key=g.__getitem__)
+            path.append(self._cell(current))
+        return path
+
+    def edit(self, added=(), removed=()):
+        # Agrega y quita obstáculos en la cuadrícula y devuelve el camino reparado.
+        changed = []
+        for cells, value in ((added, 1), (removed, 0)):
+            for cell in cells:
+                cell_id = self._id(cell)
+                if self.free[cell_id] == value:  # Solo cuenta si la celda cambia de estado
+                    self.grid[cell[0], cell[1]] = value
+                    self.free[cell_id] = 1 - value
+                    changed.append(cell_id)
+        for cell_id in changed:
+            self._update(cell_id)
+            for shift in self.shifts:
+                self._update(cell_id + shift)
+        return self.plan()
+
+    def move_start(self, start):
+        # Cambia el inicio (por ejemplo, el agente ya avanzó por el camino) y devuelve el nuevo camino.
+        start_id = self._id(start)
+        lx, ly = divmod(self.last, self.width)
+        sx, sy = divmod(start_id, self.width)
+        self.km += abs(lx - sx) + abs(ly - sy)
+        self.start = self.last = start_id
+        self.start_xy = (sx, sy)
+        return self.plan()
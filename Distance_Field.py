@@ -0,0 +1,132 @@
+import numpy as np
+import hashlib
+import weakref
+from collections import OrderedDict
+from Grid_Generator import padded_free
+
+# Distancia de las celdas desde las que no se puede llegar a la meta (y de los obstáculos).
+UNREACHABLE = -1
+
+
+def distance_field(grid, goal):
+    # Distancia exacta (en pasos 4-conexos) de cada celda libre a la meta con un solo BFS inverso
+    # que expande una capa completa por paso. Devuelve un arreglo int32 con la forma de la
+    # cuadrícula; UNREACHABLE en obstáculos y en celdas libres sin camino a la meta.
+    rows = np.shape(grid)[0]
+    free, width = padded_free(grid)
+    distance = np.full(free.size, UNREACHABLE, dtype=np.int32)
+
+    goal_id = (goal[0] + 1) * width + goal[1] + 1
+    if free[goal_id]:
+        shifts = np.array([-width, width, -1, 1])
+        distance[goal_id] = 0
+        free[goal_id] = False  # 'free' pasa a marcar las celdas aún sin distancia
+        frontier = np.array([goal_id], dtype=np.int64)
+        depth = 0
+        while frontier.size:
+            depth += 1
+            candidates = (frontier[:, None] + shifts).ravel()
+            frontier = np.unique(candidates[free[candidates]])
+            free[frontier] = False
+            distance[frontier] = depth
+
+    return distance.reshape(rows + 2, width)[1:-1, 1:-1].copy()
+
+
+def grid_key(grid):
+    # Huella de la cuadrícula: forma más un hash de la máscara de obstáculos empaquetada en bits.
+    grid = np.asarray(grid)
+    digest = hashlib.blake2b(np.packbits(grid != 0).tobytes(), digest_size=16).hexdigest()
+    return grid.shape, digest
+
+
+class DistanceFieldCache:
+    # Caché LRU de campos de distancia con clave (cuadrícula, versión, meta).
+    # La cuadrícula se identifica por el objeto, no por su contenido: hashearla en cada consulta costaría
+    # O(celdas) aun cuando el campo ya está en la caché. Si se modifica una cuadrícula en su lugar hay que
+    # pasar otra 'version' (o llamar a forget/clear); los campos de una cuadrícula que se libera se descartan.
+    # Los objetos sin referencias débiles (listas) se identifican por su huella, grid_key.
+    # Se limita por memoria: al pasar de max_bytes se descartan los campos usados hace más tiempo
+    # (el más reciente siempre se conserva).
+
+    def __init__(self, max_bytes=256 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._fields = OrderedDict()
+        self._grids = {}  # id de la cuadrícula -> referencia débil
+
+    def _token(self, grid):
+        token = id(grid)
+        if token not in self._grids:
+            try:
+                self._grids[token] = weakref.ref(grid, lambda ref, token=token: self._drop(token))
+            except TypeError:
+                return grid_key(grid)
+        return token
+
+    def _drop(self, token):
+        self._grids.pop(token, None)
+        for key in [key for key in self._fields if key[0] == token]:
+            self.nbytes -= self._fields.pop(key).nbytes
+
+    def get(self, grid, goal, version=0):
+        key = (self._token(grid), version, (int(goal[0]), int(goal[1])))
+        field = self._fields.get(key)
+        if field is not None:
+            self.hits += 1
+            self._fields.move_to_end(key)
+            return field
+
+        self.misses += 1
+        field = distance_field(grid, goal)
+        field.flags.writeable = False  # Se comparte entre consultas: nadie debe modificarlo
+        self._fields[key] = field
+        self.nbytes += field.nbytes
+        while self.nbytes > self.max_bytes and len(self._fields) > 1:
+            _, evicted = self._fields.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return field
+
+    def forget(self, grid):
+        # Descarta los campos de 'grid' (por ejemplo, después de cambiar sus obstáculos).
+        token = id(grid)
+        self._drop(token if token in self._grids else grid_key(grid))
+
+    def clear(self):
+        self._fields.clear()
+        self._grids.clear()
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._fields)
+
+
+# Caché compartida por defecto del proceso.
+default_cache = DistanceFieldCache()
+
+
+def goal_field(grid, goal, cache=None, version=0):
+    # Campo de distancia a 'goal', tomado de la caché (la de por defecto si no se indica otra).
+    return (default_cache if cache is None else cache).get(grid, goal, version)
+
+
+def descend(field, start):
+    # Camino desde 'start' hasta la meta bajando por el campo: cada paso va a un vecino con distancia
+    # una unidad menor. Nunca se atasca; devuelve [] si la meta no es alcanzable desde 'start'.
+    x, y = start
+    remaining = int(field[x, y])
+    if remaining == UNREACHABLE:
+        return []
+    rows, cols = field.shape
+    path = [(x, y)]
+    while remaining:
+        remaining -= 1
+        # Misma prioridad de movimientos que hill_climbing.
+        for nx, ny in ((x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y)):
+            if 0 <= nx < rows and 0 <= ny < cols and field[nx, ny] == remaining:
+                x, y = nx, ny
+                break
+        path.append((x, y))
+    return path
@@ -0,0 +1,179 @@
+import numpy as np
+
+# Resolución del sorteo vectorizado: cada celda recibe un entero de 16 bits.
+_LEVELS = 1 << 16
+
+
+def make_rng(seed=None):
+    # Acepta una semilla entera, un np.random.Generator ya creado o None (aleatorio).
+    return np.random.default_rng(seed)
+
+
+# Utilidades de cuadrícula compartidas por todos los motores (y por sus versiones en español).
+def initialize_grid(n):
+    # Crea una cuadrícula NxN (uint8) con todos los elementos inicializados a 0.
+    return np.zeros((n, n), dtype=np.uint8)
+
+
+def is_valid(x, y, grid):
+    # Verifica si las coordenadas (x, y) están dentro de la cuadrícula y no son un obstáculo (valor 1).
+    return 0 <= x < grid.shape[0] and 0 <= y < grid.shape[1] and grid[x, y] == 0
+
+
+def manhattan_distance(point1, point2):
+    return abs(point1[0] - point2[0]) + abs(point1[1] - point2[1])
+
+
+# Movimiento 8-conexo. Los pasos cuestan STRAIGHT en recto y DIAGONAL (~STRAIGHT * sqrt(2)) en diagonal,
+# en enteros para que g siga cabiendo en int32.
+STRAIGHT, DIAGONAL = 10, 14
+DIAGONAL_MOVES = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+# Reglas para las diagonales junto a obstáculos:
+#   'allow': basta con que la celda destino esté libre
+#   'one':   se puede rozar una esquina, pero no pasar entre dos obstáculos que se tocan en diagonal
+#   'none':  no se cortan esquinas: las dos celdas rectas intermedias deben estar libres
+CORNER_RULES = ('allow', 'one', 'none')
+
+
+def corner_allowed(side_a, side_b, corner):
+    # side_a y side_b indican si están libres las dos celdas rectas entre el origen y la diagonal.
+    if corner == 'none':
+        return side_a and side_b
+    if corner == 'one':
+        return side_a or side_b
+    if corner == 'allow':
+        return True
+    raise ValueError("Regla de esquinas desconocida: " + str(corner))
+
+
+def diagonal_moves(x, y, grid, corner='none'):
+    # Celdas diagonales de (x, y) a las que se puede pasar según la regla de esquinas.
+    return [(x + dx, y + dy) for dx, dy in DIAGONAL_MOVES
+            if is_valid(x + dx, y + dy, grid) and corner_allowed(grid[x + dx, y] == 0, grid[x, y + dy] == 0, corner)]
+
+
+def octile_distance(point1, point2):
+    # Costo exacto sin obstáculos con movimiento 8-conexo (en unidades de STRAIGHT y DIAGONAL).
+    dx, dy = abs(point1[0] - point2[0]), abs(point1[1] - point2[1])
+    return STRAIGHT * max(dx, dy) + (DIAGONAL - STRAIGHT) * min(dx, dy)
+
+
+def padded_free(grid, values=None):
+    # Máscara plana de celdas libres rodeada por un borde de obstáculos, y su ancho (columnas + 2). El id
+    # de (x, y) es (x + 1) * ancho + y + 1 y los vecinos de un id son id +-1 e id +-ancho: nunca se salen
+    # de la cuadrícula, así que los motores no revisan límites.
+    # Con 'values' (de la forma de la cuadrícula) devuelve esos valores en las celdas libres y 0 en los
+    # obstáculos y el borde, en lugar de la máscara (los costos de Weighted_Search.py).
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    free = grid == 0
+    if values is None:
+        padded = np.zeros((rows + 2, cols + 2), dtype=bool)
+        padded[1:-1, 1:-1] = free
+    else:
+        values = np.asarray(values)
+        padded = np.zeros((rows + 2, cols + 2), dtype=values.dtype)
+        padded[1:-1, 1:-1] = np.where(free, values, 0)
+    return padded.ravel(), cols + 2
+
+
+def _pick(pool, count, rng):
+    # Elige 'count' posiciones distintas (índices planos) donde la máscara 'pool' es True.
+    available = int(np.count_nonzero(pool))
+    if count > available:
+        raise ValueError("No hay suficientes celdas libres.")
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+    # Si hay que tomar una fracción grande de la máscara se listan sus índices explícitamente.
+    if count * 4 > available:
+        return rng.choice(np.flatnonzero(pool), count, replace=False)
+    # Si no, se sortean índices al azar por lotes y se descartan los que no están en la máscara.
+    chosen = np.empty(0, dtype=np.int64)
+    while chosen.size < count:
+        batch = 2 * (count - chosen.size) * pool.size // available + 16
+        candidates = rng.integers(0, pool.size, batch)
+        chosen = np.unique(np.concatenate([chosen, candidates[pool[candidates]]]))
+    return rng.choice(chosen, count, replace=False)
+
+
+def place_obstacles(grid, k, rng=None):
+    # Coloca exactamente k obstáculos (valor 1) en celdas libres elegidas uniformemente al azar.
+    rng = make_rng(rng)
+    flat = grid.reshape(-1)
+    free = flat == 0
+    available = int(np.count_nonzero(free))
+    if k > available:
+        raise ValueError("La cuadrícula no tiene suficientes celdas libres para colocar los obstáculos.")
+
+    # Un solo sorteo para toda la cuadrícula: cada celda libre es obstáculo con probabilidad k / libres.
+    threshold = min(round(k / available * _LEVELS), _LEVELS - 1) if available else 0
+    mask = rng.integers(0, _LEVELS, flat.size, dtype=np.uint16) < threshold
+    if available < flat.size:
+        mask &= free
+
+    # Se corrige la diferencia (del orden de sqrt(k)) para que el total sea exactamente k.
+    placed = int(np.count_nonzero(mask))
+    if placed > k:
+        mask[_pick(mask, placed - k, rng)] = False
+    elif placed < k:
+        free &= ~mask
+        mask[_pick(free, k - placed, rng)] = True
+
+    flat |= mask  # Mucho más rápido que flat[mask] = 1 en cuadrículas grandes.
+
+
+def sample_start_goal(grid, rng=None):
+    # Elige dos celdas libres distintas. Primero prueba unas cuantas celdas al azar, lo que
+    # evita construir la máscara completa de celdas libres; solo si fallan (cuadrícula casi
+    # llena) se recurre a la máscara.
+    rng = make_rng(rng)
+    flat = grid.reshape(-1)
+    cols = grid.shape[1]
+    for _ in range(4):
+        candidates = rng.integers(0, flat.size, 64)
+        candidates = np.unique(candidates[flat[candidates] == 0])
+        if candidates.size >= 2:
+            start, goal = rng.choice(candidates, 2, replace=False)
+            return divmod(int(start), cols), divmod(int(goal), cols)
+
+    free = flat == 0
+    if np.count_nonzero(free) < 2:
+        raise ValueError("La cuadrícula no tiene suficientes celdas libres para establecer el inicio y la meta.")
+    start, goal = _pick(free, 2, rng)
+    return divmod(int(start), cols), divmod(int(goal), cols)
+
+
+# Nombres de los scripts (DFS.py, Astar.py, BFS.py, Hill_Climbing.py y sus versiones en español), que
+# los importan de aquí.
+def genera_obstaculos(grid, n, rng=None):
+    # Coloca n obstáculos en un solo sorteo vectorizado; rng puede ser una semilla o un np.random.Generator.
+    place_obstacles(grid, n, rng)
+
+
+def genera_start_goal(grid, rng=None):
+    return sample_start_goal(grid, rng)
+
+
+def generar_obstaculos(cuadricula, n, rng=None):
+    place_obstacles(cuadricula, n, rng)
+
+
+def generar_inicio_meta(cuadricula, rng=None):
+    return sample_start_goal(cuadricula, rng)
+
+
+def random_costs(grid, max_cost, rng=None):
+    # Costos enteros de terreno entre 1 y max_cost (uniformes) para las celdas de la cuadrícula;
+    # uint8 si caben, si no uint16. Los obstáculos siguen siendo los de la cuadrícula.
+    rng = make_rng(rng)
+    dtype = np.uint8 if max_cost <= 255 else np.uint16
+    return rng.integers(1, max_cost + 1, np.shape(grid), dtype=dtype)
+
+
+def generate_scenario(n, density=0.25, seed=None):
+    # Crea una cuadrícula NxN con int(density * N^2) obstáculos, un inicio y una meta.
+    rng = make_rng(seed)
+    grid = initialize_grid(n)
+    place_obstacles(grid, int(density * n * n), rng)
+    start, goal = sample_start_goal(grid, rng)
+    return grid, start, goal
@@ -0,0 +1,114 @@
+import numpy as np
+import itertools
+from Distance_Field import goal_field
+
+# matplotlib solo se importa al dibujar (tarda más de medio segundo): los motores importan este módulo,
+# y las búsquedas sin dibujo (lotes, benchmarks, servicios) no deben pagar ese costo al arrancar.
+
+# Por encima de este tamaño ya no se escribe el número de cada casilla visitada ni se trazan
+# las líneas de la cuadrícula; el orden de visita se muestra como una capa de color.
+LABEL_LIMIT = 40
+
+
+def as_cells(cells):
+    # Convierte una lista de tuplas (x, y) en un arreglo (k, 2) sin pasar por np.array(lista).
+    if isinstance(cells, np.ndarray):
+        return cells.reshape(-1, 2)
+    return np.fromiter(itertools.chain.from_iterable(cells), dtype=np.int64, count=2 * len(cells)).reshape(-1, 2)
+
+
+def heat_layer(grid, goal):
+    # Valor de calor de cada celda a partir de la distancia real a la meta (rodeando obstáculos):
+    # 1 en la meta y cerca de 0 en la celda alcanzable más lejana; 0 en las celdas sin camino.
+    distance = goal_field(grid, goal)
+    reachable = distance >= 0
+    if not reachable.any():
+        return np.zeros(distance.shape)
+    return np.where(reachable, 1 - distance / (distance.max() + 1), 0.0)
+
+
+def build_image(grid, goal=None, visited=None, heat=False, order_cmap='Greens'):
+    # Construye la imagen RGB (uint8) con las capas de obstáculos, calor y orden de visita.
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    free = grid == 0
+
+    if heat and goal:
+        from matplotlib import colormaps
+        image = colormaps['viridis'](heat_layer(grid, goal), bytes=True)[..., :3]
+    else:
+        image = np.full((rows, cols, 3), 255, dtype=np.uint8)
+
+    if visited is not None and len(visited) > 0 and max(rows, cols) > LABEL_LIMIT:
+        from matplotlib import colormaps
+        cells = as_cells(visited)
+        # Tabla de 256 colores indexada por el orden de visita (normalizado).
+        table = colormaps[order_cmap](np.linspace(0.3, 1.0, 256), bytes=True)[:, :3]
+        colors = table[np.arange(len(cells)) * 256 // len(cells)]
+        current = image[cells[:, 0], cells[:, 1]].astype(np.uint16)
+        image[cells[:, 0], cells[:, 1]] = (current + colors) // 2
+
+    image[~free] = 0  # Obstáculos en negro
+    return image
+
+
+def render_grid(grid, start, goal, path, visited, heat=False, start_color='orange',
+                path_color='blue', text_color='green', fontsize=14, output=None, dpi=100):
+    # Dibuja toda la cuadrícula con una sola llamada a imshow.
+    # Si se indica 'output' se guarda un PNG sin abrir ninguna ventana (no se llama a plt.show()).
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+
+    if output is None:
+        import matplotlib.pyplot as plt
+        fig, ax = plt.subplots()
+    else:
+        from matplotlib.figure import Figure
+        fig = Figure()
+        ax = fig.add_subplot()
+
+    ax.set_facecolor('white')
+    image = build_image(grid, goal, visited, heat)
+    # origin='lower' conserva la orientación del dibujo original: la fila 0 queda abajo.
+    ax.imshow(image, origin='lower', extent=(0, cols, 0, rows), interpolation='nearest')
+
+    ax.scatter(start[1] + 0.5, start[0] + 0.5, color=start_color, marker='o', s=100)
+    ax.scatter(goal[1] + 0.5, goal[0] + 0.5, color='red', marker='x', s=100)
+
+    if path:
+        cells = as_cells(path)
+        ax.plot(cells[:, 1] + 0.5, cells[:, 0] + 0.5, color=path_color, label='Camino')
+
+    if visited is not None and len(visited) > 0 and max(rows, cols) <= LABEL_LIMIT:
+        for i, (x, y) in enumerate(visited, 1):
+            ax.text(y + 0.5, x + 0.5, str(i), ha='center', va='center', color=text_color, fontsize=fontsize)
+
+    if max(rows, cols) <= LABEL_LIMIT:
+        ax.hlines(range(rows + 1), 0, cols, color='black', linewidth=0.1)
+        ax.vlines(range(cols + 1), 0, rows, color='black', linewidth=0.1)
+
+    if path:
+        ax.legend()
+
+    if output is None:
+        plt.show()
+    else:
+        fig.savefig(output, dpi=dpi)
+
+
+# Estilo de cada script: capa de calor y colores del inicio, del camino y de los números de visita.
+STYLES = {
+    'dfs': dict(heat=False, start_color='orange', path_color='blue', text_color='green'),
+    'hill_climbing': dict(heat=False, start_color='orange', path_color='blue', text_color='green', fontsize=10),
+    'heat_map': dict(heat=True, start_color='orange', path_color='blue', text_color='white'),
+    'a_star': dict(heat=True, start_color='white', path_color='white', text_color='white'),
+}
+
+
+def draw_grid(grid, start, goal, path, visited, output=None, style='dfs'):
+    # render_grid con el estilo de un script (ver STYLES); con 'output' se exporta a PNG sin mostrar ventana.
+    render_grid(grid, start, goal, path, visited, output=output, **STYLES[style])
+
+
+def dibujar_cuadricula(cuadricula, inicio, meta, camino, visitados, salida=None, estilo='dfs'):
+    draw_grid(cuadricula, inicio, meta, camino, visitados, salida, estilo)
@@ -0,0 +1,84 @@
+import numpy as np
+import struct
+
+# Formato en disco de una cuadrícula: una cabecera de 64 bytes seguida de las celdas fila por fila.
+#   cabecera: firma, versión, codificación, filas, columnas (little-endian), rellenada con ceros
+#   UINT8: 1 byte por celda (0 libre, 1 obstáculo); se abre con np.memmap sin copiar nada
+#   BITS:  1 bit por celda, cada fila empaquetada con np.packbits (ceil(columnas / 8) bytes por fila)
+MAGIC = b'NXNGRID\x00'
+VERSION = 1
+UINT8, BITS = 0, 1
+HEADER = struct.Struct('<8sHBxQQ')
+HEADER_SIZE = 64
+
+# Filas que se convierten por bloque al guardar o desempaquetar, para no crear temporales del tamaño
+# de toda la cuadrícula.
+_BAND_CELLS = 1 << 24
+
+
+def _band(cols):
+    return max(1, _BAND_CELLS // max(cols, 1))
+
+
+def _write_header(handle, encoding, rows, cols):
+    handle.write(HEADER.pack(MAGIC, VERSION, encoding, rows, cols).ljust(HEADER_SIZE, b'\x00'))
+
+
+def read_header(path):
+    # Devuelve (codificación, filas, columnas) y comprueba que el archivo tenga el tamaño esperado.
+    with open(path, 'rb') as handle:
+        raw = handle.read(HEADER_SIZE)
+        handle.seek(0, 2)
+        size = handle.tell()
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("El archivo no tiene una cabecera de cuadrícula completa: " + str(path))
+    magic, version, encoding, rows, cols = HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError("El archivo no es una cuadrícula: " + str(path))
+    if version != VERSION or encoding not in (UINT8, BITS):
+        raise ValueError("Versión o codificación de cuadrícula no soportada: " + str((version, encoding)))
+    row_bytes = cols if encoding == UINT8 else (cols + 7) // 8
+    if size < HEADER_SIZE + rows * row_bytes:
+        raise ValueError("El archivo de cuadrícula está truncado: " + str(path))
+    return encoding, rows, cols
+
+
+def save_grid(path, grid, packed=False):
+    # Guarda la cuadrícula (cualquier celda distinta de 0 es obstáculo). Con packed=True ocupa 1 bit por
+    # celda, pero al abrirla hay que desempaquetarla; sin él se abre con memoria mapeada.
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    band = _band(cols)
+    with open(path, 'wb') as handle:
+        _write_header(handle, BITS if packed else UINT8, rows, cols)
+        for top in range(0, rows, band):
+            cells = grid[top:top + band] != 0
+            handle.write((np.packbits(cells, axis=1) if packed else cells.view(np.uint8)).tobytes())
+
+
+def create_grid(path, rows, cols):
+    # Crea en disco una cuadrícula UINT8 vacía (sin obstáculos) y la devuelve abierta para escritura.
+    # El archivo se extiende sin escribir las celdas, así que crearla es instantáneo aunque sea enorme.
+    with open(path, 'wb') as handle:
+        _write_header(handle, UINT8, rows, cols)
+        handle.truncate(HEADER_SIZE + rows * cols)
+    return open_grid(path, mode='r+')
+
+
+def open_grid(path, mode='r'):
+    # Abre una cuadrícula guardada. Las UINT8 se devuelven como np.memmap (uint8, forma (filas, columnas)):
+    # abrirla es inmediato y solo se leen del disco las páginas que toca la búsqueda. Con mode='r+' los
+    # cambios (por ejemplo DStarLite.edit) se escriben en el archivo.
+    # Las BITS se desempaquetan en memoria a un arreglo uint8 (1 byte por celda).
+    encoding, rows, cols = read_header(path)
+    if encoding == UINT8:
+        return np.memmap(path, dtype=np.uint8, mode=mode, offset=HEADER_SIZE, shape=(rows, cols))
+
+    if mode != 'r':
+        raise ValueError("Las cuadrículas empaquetadas en bits solo se pueden abrir para lectura.")
+    packed = np.memmap(path, dtype=np.uint8, mode='r', offset=HEADER_SIZE, shape=(rows, (cols + 7) // 8))
+    grid = np.empty((rows, cols), dtype=np.uint8)
+    band = _band(cols)
+    for top in range(0, rows, band):
+        grid[top:top + band] = np.unpackbits(packed[top:top + band], axis=1, count=cols)
+    return grid
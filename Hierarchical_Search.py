@@ -0,0 +1,349 @@
+import argparse
+import heapq
+import os
+import time
+
+import numpy as np
+
+from Astar import a_star, manhattan_distance
+from Distance_Field import distance_field, grid_key, UNREACHABLE
+from Grid_Generator import generate_scenario, make_rng, sample_start_goal
+
+# Una entrada entre dos clústeres de este largo o más se conecta con dos transiciones (en sus
+# extremos); las más cortas, con una sola en el centro.
+WIDE_ENTRANCE = 6
+
+
+def _runs(mask):
+    # Tramos (inicio, fin) inclusivos de valores True consecutivos en un arreglo 1D.
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return zip(np.flatnonzero(edges == 1).tolist(), (np.flatnonzero(edges == -1) - 1).tolist())
+
+
+class Hierarchy:
+    # Abstracción de una cuadrícula estática para búsqueda jerárquica (HPA*): la cuadrícula se divide en
+    # clústeres de cluster_size x cluster_size, las celdas de transición entre clústeres vecinos son los
+    # nodos y las aristas son el paso entre clústeres (costo 1) o la distancia dentro de un clúster.
+    #   nodes:                    celdas de los nodos (N, 2) int32
+    #   offsets, targets, costs:  aristas en formato CSR (las de nodo i: targets[offsets[i]:offsets[i + 1]])
+    #   key:                      huella de la cuadrícula (Distance_Field.grid_key) para validar la caché
+    # Se construye con build_hierarchy, se guarda con save y se recupera con load_hierarchy.
+
+    def __init__(self, shape, cluster_size, key, nodes, offsets, targets, costs):
+        self.shape = tuple(shape)
+        self.cluster_size = cluster_size
+        self.key = key
+        self.nodes = nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.costs = costs
+
+        # Listas de Python para la búsqueda: celdas, aristas por nodo y nodos por clúster.
+        self._cells = [tuple(cell) for cell in nodes.tolist()]
+        targets, costs, offsets = targets.tolist(), costs.tolist(), offsets.tolist()
+        self._edges = [list(zip(targets[offsets[i]:offsets[i + 1]], costs[offsets[i]:offsets[i + 1]]))
+                       for i in range(len(self._cells))]
+        self._members = {}
+        for node, cell in enumerate(self._cells):
+            self._members.setdefault(self.cluster_of(cell), []).append(node)
+
+    def cluster_of(self, cell):
+        return cell[0] // self.cluster_size, cell[1] // self.cluster_size
+
+    def window(self, cluster):
+        # Límites (x0, x1, y0, y1) de las celdas del clúster.
+        k = self.cluster_size
+        return (cluster[0] * k, min((cluster[0] + 1) * k, self.shape[0]),
+                cluster[1] * k, min((cluster[1] + 1) * k, self.shape[1]))
+
+    def _links(self, grid, cell, target=None):
+        # Distancias, dentro de su clúster, de 'cell' a los nodos del clúster (y a 'target' si está en él).
+        cluster = self.cluster_of(cell)
+        x0, x1, y0, y1 = self.window(cluster)
+        field = distance_field(grid[x0:x1, y0:y1], (cell[0] - x0, cell[1] - y0))
+        links = []
+        for node in self._members.get(cluster, []):
+            x, y = self._cells[node]
+            distance = int(field[x - x0, y - y0])
+            if distance != UNREACHABLE:
+                links.append((node, distance))
+        direct = None
+        if target is not None and self.cluster_of(target) == cluster:
+            distance = int(field[target[0] - x0, target[1] - y0])
+            direct = None if distance == UNREACHABLE else distance
+        return links, direct
+
+    def search(self, grid, start, goal, stats=None, components=None):
+        # Busca en el grafo abstracto y refina solo los tramos elegidos con a_star dentro de cada clúster.
+        # Devuelve el camino como lista de tuplas (x, y), o None si no hay (igual que a_star).
+        if components is not None and not components.reachable(start, goal):
+            return None
+        grid = np.asarray(grid)
+        start, goal = tuple(start), tuple(goal)
+        if grid[start] or grid[goal]:
+            return None
+        if start == goal:
+            return [start]
+
+        # El inicio y la meta se insertan como nodos temporales conectados a los nodos de su clúster.
+        start_node, goal_node = len(self._cells), len(self._cells) + 1
+        cells = self._cells + [start, goal]
+        start_links, direct = self._links(grid, start, goal)
+        goal_links = dict(self._links(grid, goal)[0])
+        if direct is not None:
+            start_links.append((goal_node, direct))
+
+        def neighbors(node):
+            edges = start_links if node == start_node else self._edges[node]
+            if node in goal_links:
+                return edges + [(goal_node, goal_links[node])]
+            return edges
+
+        # A* sobre el grafo abstracto: (f, -g, orden de inserción, nodo), con borrado perezoso. A igual f
+        # se prefiere el nodo con mayor g (el más cercano a la meta), como en jump_point_search.
+        open_heap = [(manhattan_distance(start, goal), 0, 0, start_node)]
+        counter = 1
+        g_score = {start_node: 0}
+        came_from = {start_node: None}
+        closed = set()
+
+        push, pop = heapq.heappush, heapq.heappop
+        if stats is not None:
+            push = stats.frontier_push(push, open_heap, lambda entry: cells[entry[3]])
+            pop = stats.frontier_pop(pop)
+            neighbors = stats.expansion(neighbors, cells.__getitem__)
+
+        while open_heap:
+            _, _, _, current = pop(open_heap)
+            if current in closed:
+                if stats is not None:
+                    stats.reopened += 1
+                continue
+            if current == goal_node:
+                break
+            closed.add(current)
+            for neighbor, cost in neighbors(current):
+                tentative_g_score = g_score[current] + cost
+                if tentative_g_score < g_score.get(neighbor, tentative_g_score + 1):
+                    g_score[neighbor] = tentative_g_score
+                    came_from[neighbor] = current
+                    push(open_heap, (tentative_g_score + manhattan_distance(cells[neighbor], goal), -tentative_g_score,
+                                     counter, neighbor))
+                    counter += 1
+        else:
+            return None  # No se encontró un camino válido
+
+        abstract = [goal_node]
+        while came_from[abstract[-1]] is not None:
+            abstract.append(came_from[abstract[-1]])
+        abstract.reverse()
+        return self.refine(grid, [cells[node] for node in abstract])
+
+    def refine(self, grid, waypoints):
+        # Convierte la secuencia de celdas del camino abstracto en un camino de celdas vecinas: los pasos
+        # entre clústeres ya son de una celda y los tramos dentro de un clúster se resuelven con a_star
+        # sobre la vista del clúster (sin copiar la cuadrícula).
+        path = [waypoints[0]]
+        for a, b in zip(waypoints, waypoints[1:]):
+            if manhattan_distance(a, b) == 1:
+                path.append(b)
+                continue
+            x0, x1, y0, y1 = self.window(self.cluster_of(a))
+            segment = a_star(grid[x0:x1, y0:y1], (a[0] - x0, a[1] - y0), (b[0] - x0, b[1] - y0))
+            path.extend((x + x0, y + y0) for x, y in segment[1:])
+        return path
+
+    def save(self, path):
+        # Guarda la abstracción (.npz) para no recalcularla; load_hierarchy la valida contra la cuadrícula.
+        shape, digest = self.key
+        np.savez(path, shape=np.array(self.shape), cluster_size=self.cluster_size, digest=np.array(digest),
+                 nodes=self.nodes, offsets=self.offsets, targets=self.targets, costs=self.costs)
+
+
+def _cluster_distances(blocks, local, rows, targets):
+    # BFS simultáneo desde varios nodos, cada uno restringido a su bloque k x k (k <= 64). Cada fila de un
+    # bloque es un entero de 64 bits (bit j = columna j), así una capa de todos los BFS son unos pocos
+    # desplazamientos y operaciones de bits sobre un arreglo (m, k).
+    #   local:   celda de origen de cada BFS dentro de su bloque
+    #   rows, targets: consultas; la distancia del BFS rows[i] a la celda local targets[i]
+    # Devuelve la distancia de cada consulta (UNREACHABLE si no hay camino dentro del bloque).
+    count, k = len(blocks), blocks.shape[1]
+    weights = np.left_shift(np.uint64(1), np.arange(k, dtype=np.uint64))
+    unreached = (blocks.astype(np.uint64) * weights).sum(axis=2, dtype=np.uint64)
+    frontier = np.zeros((count, k), dtype=np.uint64)
+    frontier[np.arange(count), local[:, 0]] = weights[local[:, 1]]
+    unreached &= ~frontier
+
+    one = np.uint64(1)
+    target_bits = weights[targets[:, 1]]
+    distance = np.full(len(rows), UNREACHABLE, dtype=np.int32)
+    depth = 0
+    while True:
+        grown = (frontier << one) | (frontier >> one)
+        grown[:, 1:] |= frontier[:, :-1]
+        grown[:, :-1] |= frontier[:, 1:]
+        grown &= unreached
+        if not grown.any():
+            break
+        depth += 1
+        unreached ^= grown
+        distance[(grown[rows, targets[:, 0]] & target_bits) != 0] = depth
+        frontier = grown
+    return distance
+
+
+def build_hierarchy(grid, cluster_size=16, chunk=2048):
+    # Precalcula la abstracción: entradas entre clústeres vecinos y distancias entre los nodos de cada clúster.
+    # Las distancias internas se calculan con BFS vectorizados de 'chunk' nodos a la vez.
+    if not 2 <= cluster_size <= 64:
+        raise ValueError("El lado de los clústeres debe estar entre 2 y 64.")
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    k = cluster_size
+    free = grid == 0
+    node_of = {}   # celda -> id de nodo
+    crossings = []  # pares de nodos vecinos en clústeres distintos (costo 1)
+
+    def node(cell):
+        if cell not in node_of:
+            node_of[cell] = len(node_of)
+        return node_of[cell]
+
+    # Entradas: tramos de celdas libres a ambos lados de cada borde, separados por clúster.
+    # Bordes verticales (entre columnas y - 1 e y) y horizontales (entre filas x - 1 y x).
+    for border, pairs, length, side in (
+        (range(k, cols, k), lambda y: free[:, y - 1] & free[:, y], rows, lambda y, i: ((i, y - 1), (i, y))),
+        (range(k, rows, k), lambda x: free[x - 1, :] & free[x, :], cols, lambda x, i: ((x - 1, i), (x, i))),
+    ):
+        for line in border:
+            open_pairs = pairs(line)
+            for begin in range(0, length, k):
+                for first, last in _runs(open_pairs[begin:begin + k]):
+                    if last - first + 1 >= WIDE_ENTRANCE:
+                        chosen = (first, last)
+                    else:
+                        chosen = ((first + last) // 2,)
+                    for i in chosen:
+                        a, b = side(line, begin + i)
+                        crossings.append((node(a), node(b)))
+
+    nodes = np.zeros((len(node_of), 2), dtype=np.int32)
+    for cell, index in node_of.items():
+        nodes[index] = cell
+    crossings = np.array(crossings, dtype=np.int32).reshape(-1, 2)
+
+    # Pares (origen, destino) de nodos distintos del mismo clúster, agrupados por origen.
+    cluster = (nodes[:, 0] // k) * (-(-cols // k)) + nodes[:, 1] // k
+    order = np.argsort(cluster, kind='stable')
+    bounds = np.flatnonzero(np.diff(cluster[order])) + 1
+    same = []
+    for group in np.split(order, bounds):
+        if len(group) > 1:
+            same.append(np.stack([np.repeat(group, len(group)), np.tile(group, len(group))], axis=1))
+    same = np.concatenate(same) if same else np.empty((0, 2), dtype=np.int64)
+    same = same[same[:, 0] != same[:, 1]]
+    same = same[np.argsort(same[:, 0], kind='stable')]
+
+    # Bloques k x k de celdas libres (rellenando con obstáculos hasta un múltiplo de k).
+    padded = np.zeros((-(-rows // k) * k, -(-cols // k) * k), dtype=bool)
+    padded[:rows, :cols] = free
+    blocks = padded.reshape(padded.shape[0] // k, k, padded.shape[1] // k, k).swapaxes(1, 2)
+
+    intra_costs = np.empty(len(same), dtype=np.int32)
+    first_pair = np.searchsorted(same[:, 0], np.arange(0, len(nodes) + chunk, chunk))
+    for part, begin in enumerate(range(0, len(nodes), chunk)):
+        sources = np.arange(begin, min(begin + chunk, len(nodes)))
+        origin = (nodes[sources] // k) * k
+        low, high = first_pair[part], first_pair[part + 1]
+        pairs = same[low:high]
+        intra_costs[low:high] = _cluster_distances(blocks[nodes[sources, 0] // k, nodes[sources, 1] // k],
+                                                   nodes[sources] - origin, pairs[:, 0] - begin,
+                                                   nodes[pairs[:, 1]] - origin[pairs[:, 0] - begin])
+    reachable = intra_costs != UNREACHABLE
+    same, intra_costs = same[reachable], intra_costs[reachable]
+
+    # Aristas en CSR: cruces en ambos sentidos (costo 1) más las internas.
+    sources = np.concatenate([crossings[:, 0], crossings[:, 1], same[:, 0]])
+    targets = np.concatenate([crossings[:, 1], crossings[:, 0], same[:, 1]]).astype(np.int32)
+    costs = np.concatenate([np.ones(2 * len(crossings), dtype=np.int32), intra_costs])
+    order = np.argsort(sources, kind='stable')
+    offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=len(nodes)), out=offsets[1:])
+    return Hierarchy(grid.shape, k, grid_key(grid), nodes, offsets, targets[order], costs[order])
+
+
+def load_hierarchy(path, grid=None):
+    # Recupera una abstracción guardada con Hierarchy.save. Si se da la cuadrícula, comprueba que sea la misma.
+    with np.load(path) as data:
+        shape = tuple(data['shape'].tolist())
+        key = (shape, str(data['digest']))
+        hierarchy = Hierarchy(shape, int(data['cluster_size']), key, data['nodes'], data['offsets'],
+                              data['targets'], data['costs'])
+    if grid is not None and grid_key(grid) != key:
+        raise ValueError("La jerarquía guardada no corresponde a esta cuadrícula: " + str(path))
+    return hierarchy
+
+
+def cached_hierarchy(grid, path, cluster_size=16):
+    # Carga la abstracción de 'path' si corresponde a la cuadrícula; si no, la construye y la guarda.
+    if os.path.exists(path):
+        try:
+            hierarchy = load_hierarchy(path, grid)
+            if hierarchy.cluster_size == cluster_size:
+                return hierarchy
+        except ValueError:
+            pass
+    hierarchy = build_hierarchy(grid, cluster_size)
+    hierarchy.save(path)
+    return hierarchy
+
+
+def hpa_star(grid, start, goal, hierarchy, stats=None, components=None):
+    # Igual que a_star, pero buscando sobre una abstracción precalculada (build_hierarchy / load_hierarchy).
+    # Los caminos son casi óptimos: dentro de cada clúster se usa la distancia sin salir de él.
+    return hierarchy.search(grid, start, goal, stats, components)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara el tiempo por consulta de hpa_star contra a_star.")
+    parser.add_argument('--size', type=int, default=512)
+    parser.add_argument('--density', type=float, default=0.25)
+    parser.add_argument('--cluster', type=int, default=16, help="Lado de cada clúster.")
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cache', help="Archivo .npz donde guardar (o de donde leer) la abstracción.")
+    args = parser.parse_args()
+
+    grid, _, _ = generate_scenario(args.size, args.density, args.seed)
+    started = time.perf_counter()
+    if args.cache:
+        hierarchy = cached_hierarchy(grid, args.cache, args.cluster)
+    else:
+        hierarchy = build_hierarchy(grid, args.cluster)
+    print("Abstracción: {} nodos, {} aristas, {:.2f}s".format(
+        len(hierarchy.nodes), len(hierarchy.targets) // 2, time.perf_counter() - started))
+
+    rng = make_rng(args.seed + 1)
+    flat_time = hierarchical_time = 0.0
+    flat_length = hierarchical_length = 0
+    for _ in range(args.queries):
+        start, goal = sample_start_goal(grid, rng)
+        started = time.perf_counter()
+        path = a_star(grid, start, goal)
+        flat_time += time.perf_counter() - started
+        started = time.perf_counter()
+        approximate = hpa_star(grid, start, goal, hierarchy)
+        hierarchical_time += time.perf_counter() - started
+        if path:
+            flat_length += len(path)
+            hierarchical_length += len(approximate)
+
+    print("a_star:   {:.4f}s por consulta".format(flat_time / args.queries))
+    print("hpa_star: {:.4f}s por consulta ({:.1f}x más rápido)".format(
+        hierarchical_time / args.queries, flat_time / max(hierarchical_time, 1e-9)))
+    if flat_length:
+        print("Longitud de los caminos: {:.3f} veces la óptima".format(hierarchical_length / flat_length))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,52 +1,99 @@
-import matplotlib.pyplot as plt
 import numpy as np
-import random
+import math
+import time
+from functools import partial
+import Grid_Renderer
+from Grid_Generator import make_rng, initialize_grid, genera_obstaculos, genera_start_goal, is_valid, manhattan_distance
+from Grid_Generator import diagonal_moves, octile_distance, padded_free
+from Distance_Field import UNREACHABLE
+from Search_Stats import collect_events
 
-def initialize_grid(n):
-    return np.zeros((n, n), dtype=int)
+draw_grid = partial(Grid_Renderer.draw_grid, style='hill_climbing')
 
-def is_valid(x, y, grid):
-    return 0 <= x < len(grid) and 0 <= y < len(grid[0]) and grid[x][y] == 0
-
-def genera_obstaculos(grid, n):
-    for _ in range(n):
-        x, y = random.randint(0, len(grid) - 1), random.randint(0, len(grid[0]) - 1)
-        while grid[x][y] == 1:
-            x, y = random.randint(0, len(grid) - 1), random.randint(0, len(grid[0]) - 1)
-        grid[x][y] = 1
+def hill_climbing(grid, start, goal, max_iterations, stats=None, components=None, field=None, connectivity=4,
+                  corner='none'):
+    # Devuelve el camino seguido y la lista de nodos visitados en orden.
+    visited_list, path = collect_events(hill_climbing_events(grid, start, goal, max_iterations, stats, components, field,
+                                                             connectivity, corner))
+    return path, visited_list
 
-def genera_start_goal(grid):
-    empty_cells = [(x, y) for x in range(len(grid)) for y in range(len(grid[0])) if grid[x][y] == 0]
-    if len(empty_cells) < 2:
-        raise ValueError("La cuadrícula no tiene suficientes celdas libres para establecer el inicio y la meta.")
-    start, goal = random.sample(empty_cells, 2)
-    return start, goal
+def hill_climbing_path(grid, start, goal, max_iterations=None, stats=None, components=None):
+    # Camino de hill_climbing para corridas automáticas (Benchmark.py, Run_Search.py), o [] si no llega.
+    # A lo sumo max_iterations pasos (por defecto N^2/4, como main) y se detiene en cuanto se queda sin
+    # movimientos: hill_climbing repetiría la celda atascada hasta agotar las iteraciones.
+    if max_iterations is None:
+        max_iterations = max(grid.size // 4, 1)
+    events = hill_climbing_events(grid, start, goal, max_iterations, stats, components)
+    while True:
+        try:
+            options = next(events)[2]
+        except StopIteration as finished:
+            path = finished.value
+            return path if path and tuple(path[-1]) == tuple(goal) else []
+        if not options:
+            events.close()  # Atascado: cierra el generador (registra las estadísticas) sin seguir iterando
+            return []
 
-def manhattan_distance(point1, point2):
-    return abs(point1[0] - point2[0]) + abs(point1[1] - point2[1])
+def hill_climbing_events(grid, start, goal, max_iterations, stats=None, components=None, field=None, connectivity=4,
+                         corner='none'):
+    # Versión generadora de hill_climbing: produce (celda, orden, opciones) en cada paso, con orden desde 1;
+    # no hay frontera, así que 'opciones' es el número de movimientos válidos no visitados. No guarda la
+    # lista de visitados; al terminar devuelve el camino (valor de StopIteration, o resultado de 'yield from').
+    # Con connectivity=8 también se consideran las diagonales que permite 'corner' y, sin campo, los
+    # movimientos se ordenan por la distancia octil.
+    if connectivity not in (4, 8):
+        raise ValueError("La conectividad debe ser 4 u 8: " + str(connectivity))
+    if field is not None and connectivity != 4:
+        # El campo mide pasos de 4 vecinos: ordenaría mal las diagonales (como en a_star).
+        raise ValueError("El campo de distancia solo sirve para ordenar movimientos con 4 vecinos.")
+    if components is not None and not components.reachable(start, goal):
+        return []
+    # Con un campo de distancia a la meta (Distance_Field.goal_field) los movimientos se ordenan por
+    # la distancia real en vez de la manhattan; siempre hay un vecino más cercano y nunca se atasca.
+    if field is None and connectivity == 8:
+        rank = lambda move: octile_distance(move, goal)
+    elif field is None:
+        rank = lambda move: manhattan_distance(move, goal)
+    elif field[start[0], start[1]] == UNREACHABLE:
+        return []
+    else:
+        rank = lambda move: field[move] if is_valid(move[0], move[1], grid) else max_iterations
 
-def hill_climbing(grid, start, goal, max_iterations):
     current = start
     visited = set()
-    visited_list = []
     path = []
     iterations = 0
+    on_expand = stats.on_expand if stats is not None else None
+    started = time.perf_counter() if stats is not None and stats.timing else None
 
-    while current != goal and iterations < max_iterations:
-        visited.add(current)
-        visited_list.append(current)
-        path.append(current)
-        x, y = current
-
-        moves = [(x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y)]
-        moves.sort(key=lambda move: manhattan_distance(move, goal))
+    try:
+        while current != goal and iterations < max_iterations:
+            if on_expand:
+                on_expand(current)
+            visited.add(current)
+            path.append(current)
+            x, y = current
 
-        for move in moves:
-            if is_valid(move[0], move[1], grid) and move not in visited:
-                current = move
-                break
+            moves = [(x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y)]
+            if connectivity == 8:
+                moves += diagonal_moves(x, y, grid, corner)
+            moves.sort(key=rank)
+            options = [move for move in moves if is_valid(move[0], move[1], grid) and move not in visited]
 
-        iterations += 1
+            iterations += 1
+            yield current, iterations, len(options)
+            if options:
+                current = options[0]
+    finally:
+        if stats is not None:
+            # Cada paso expande la celda actual y genera sus cuatro (u ocho) movimientos; no hay frontera.
+            # Se registra aunque quien consume los eventos deje de iterar antes.
+            stats.expanded += iterations
+            stats.generated += connectivity * iterations
+            stats.peak_frontier = max(stats.peak_frontier, connectivity if iterations else 0)
+            stats.stuck = current != goal
+            if started is not None:
+                stats.neighbor_time += time.perf_counter() - started
 
     if iterations >= max_iterations:
         print("El algoritmo se atascó después de", max_iterations, "iteraciones.")
@@ -54,56 +101,157 @@ def hill_climbing(grid, start, goal, max_iterations):
     if current == goal:
         path.append(goal)  # Agregar la posición del objetivo si no se alcanza
 
-    return path, visited_list
+    return path
 
-def draw_grid(grid, start, goal, path, visited):
-    fig, ax = plt.subplots()
+def hill_climbing_batch(grid, starts, goals, max_iterations, chunk_bytes=64 * 2 ** 20):
+    # Avanza K escaladores voraces a la vez con operaciones de NumPy; cada uno sigue exactamente la misma
+    # regla que hill_climbing (el movimiento válido no visitado más cercano a la meta, con los empates en
+    # el orden de 'moves'), pero un paso de todos los escaladores es un puñado de operaciones vectoriales.
+    #   starts: (K, 2) celdas de inicio; goals: (K, 2), o una sola meta (x, y) para todos
+    # Los visitados son una máscara por escalador; se procesan bloques de escaladores para que las máscaras
+    # no pasen de chunk_bytes. Devuelve (llegó, longitudes, offsets, celdas), con el formato de solve_batch:
+    # celdas[offsets[i]:offsets[i + 1]] es la trayectoria del escalador i (sin las repeticiones de la celda
+    # en la que se atascó) y llegó[i] indica si terminó en la meta.
+    free, width = padded_free(grid)
+    # Mismo orden que hill_climbing: (x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y).
+    shifts = np.array([1, -1, width, -width])
 
-    ax.set_facecolor('white')
-    cell_size = 1
+    starts = np.asarray(starts, dtype=np.int64).reshape(-1, 2)
+    goals = np.broadcast_to(np.asarray(goals, dtype=np.int64).reshape(-1, 2), starts.shape)
+    start_ids = (starts[:, 0] + 1) * width + starts[:, 1] + 1
+    goal_ids = (goals[:, 0] + 1) * width + goals[:, 1] + 1
+    count = len(starts)
+    chunk = max(1, chunk_bytes // free.size)
 
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == 1:
-                ax.add_patch(plt.Rectangle((j * cell_size, i * cell_size), cell_size, cell_size, color='black'))
-            elif grid[i][j] == 0:
-                ax.add_patch(plt.Rectangle((j * cell_size, i * cell_size), cell_size, cell_size, color='white',
-                                          edgecolor='black'))
+    # Registro de movimientos: (escalador, celda) por paso; al final se agrupa por escalador.
+    log_climbers, log_cells = [np.arange(count)], [start_ids]
+    found = start_ids == goal_ids
+    for begin in range(0, count, chunk):
+        climbers = np.arange(begin, min(begin + chunk, count))
+        visited = np.zeros((len(climbers), free.size), dtype=bool)
+        row = np.arange(len(climbers))  # Fila de cada escalador en 'visited'
+        position = start_ids[climbers]
+        goal_x, goal_y = goals[climbers, 0], goals[climbers, 1]
+        active = position != goal_ids[climbers]
+        climbers, row, position, goal_x, goal_y = climbers[active], row[active], position[active], goal_x[active], goal_y[active]
 
-    plt.scatter(start[1] * cell_size + cell_size / 2, start[0] * cell_size + cell_size / 2, color='orange', marker='o',
-                s=100)
-    plt.scatter(goal[1] * cell_size + cell_size / 2, goal[0] * cell_size + cell_size / 2, color='red', marker='x',
-                s=100)
+        for step in range(max_iterations):
+            if not climbers.size:
+                break
+            visited[row, position] = True
+            candidates = position[:, None] + shifts
+            valid = free[candidates] & ~visited[row[:, None], candidates]
+            distance = np.abs(candidates // width - 1 - goal_x[:, None]) + np.abs(candidates % width - 1 - goal_y[:, None])
+            best = np.argmin(np.where(valid, distance, np.iinfo(np.int64).max), axis=1)
+            moved = valid[np.arange(len(best)), best]
 
-    if path:
-        path_x, path_y = zip(*path)
-        path_x = [x * cell_size + cell_size / 2 for x in path_x]
-        path_y = [y * cell_size + cell_size / 2 for y in path_y]
-        plt.plot(path_y, path_x, color='blue', label='Camino')
-
-    if visited:
-        visited_x, visited_y = zip(*visited)
-        visited_x = [x * cell_size + cell_size / 2 for x in visited_x]
-        visited_y = [y * cell_size + cell_size / 2 for y in visited_y]
-        for i, (x, y) in enumerate(zip(visited_x, visited_y), 1):
-            plt.text(y, x, str(i), ha='center', va='center', color='green', fontsize=10)
-
-    for i in range(len(grid) + 1):
-        plt.axhline(y=i * cell_size, color='black', linewidth=0.1)
-    for j in range(len(grid[0]) + 1):
-        plt.axvline(x=j * cell_size, color='black', linewidth=0.1)
-
-    plt.legend()
-    plt.show()
+            # Los que no tienen movimiento se atascan para siempre: salen del bloque.
+            climbers, row, goal_x, goal_y = climbers[moved], row[moved], goal_x[moved], goal_y[moved]
+            position = candidates[moved, best[moved]]
+            arrived = position == goal_ids[climbers]
+            found[climbers[arrived]] = True
+            # Como en hill_climbing, la celda a la que llega el último paso solo cuenta si es la meta.
+            last = step == max_iterations - 1
+            log_climbers.append(climbers[arrived] if last else climbers)
+            log_cells.append(position[arrived] if last else position)
+
+            keep = ~arrived
+            climbers, row, position, goal_x, goal_y = climbers[keep], row[keep], position[keep], goal_x[keep], goal_y[keep]
+
+    log_climbers = np.concatenate(log_climbers)
+    order = np.argsort(log_climbers, kind='stable')  # Estable: cada trayectoria queda en orden de pasos
+    ids = np.concatenate(log_cells)[order]
+    lengths = np.bincount(log_climbers, minlength=count).astype(np.int32)
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    cells = np.stack([ids // width - 1, ids % width - 1], axis=1).astype(np.int32)
+    return found, lengths, offsets, cells
+
+def random_restart_climbing(grid, start, goal, max_iterations, rng=None, noise=0.1, should_stop=None):
+    # Ascenso de colina estocástico con reinicios: en cada paso va al movimiento válido no visitado más
+    # cercano a la meta (los empates se sortean) o, con probabilidad 'noise', a uno cualquiera. Si se queda
+    # sin movimientos vuelve a empezar desde el inicio con otro sorteo. max_iterations limita los pasos
+    # totales y should_stop() se consulta cada 1024 pasos para abandonar (por ejemplo, si otro escalador ganó).
+    # Devuelve (camino, visitados) como hill_climbing; el camino queda vacío si no llegó a la meta.
+    rng = make_rng(rng)
+    visited_list = []
+    current, path, visited = start, [start], {start}
+    for iteration in range(max_iterations):
+        if current == goal:
+            break
+        if iteration % 1024 == 0:
+            if should_stop is not None and should_stop():
+                break
+            draws = rng.random((1024, 2)).tolist()  # Sorteos por bloque: uno por paso y otro para elegir
+        explore, pick = draws[iteration % 1024]
+        visited_list.append(current)
+        x, y = current
+
+        options = [move for move in ((x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y))
+                   if is_valid(move[0], move[1], grid) and move not in visited]
+        if not options:
+            current, path, visited = start, [start], {start}  # Mínimo local: reinicio
+            continue
+        if explore >= noise:
+            best = min(manhattan_distance(move, goal) for move in options)
+            options = [move for move in options if manhattan_distance(move, goal) == best]
+        current = options[int(pick * len(options))]
+        visited.add(current)
+        path.append(current)
+
+    return (path if current == goal else []), visited_list
+
+def simulated_annealing(grid, start, goal, max_iterations, rng=None, temperature=2.0, cooling=None, should_stop=None):
+    # Recocido simulado: en cada paso se propone un vecino válido al azar; si acerca a la meta (manhattan)
+    # se acepta siempre y si aleja, con probabilidad exp(-1 / T). T empieza en 'temperature' y se multiplica
+    # por 'cooling' en cada paso (por defecto, lo necesario para llegar a 0.05 en max_iterations pasos).
+    # Al volver a una celda del camino se borra el ciclo, así el camino final no repite celdas.
+    # should_stop() se consulta cada 1024 pasos. Devuelve (camino, visitados) como hill_climbing.
+    rng = make_rng(rng)
+    if cooling is None:
+        cooling = (0.05 / temperature) ** (1 / max(max_iterations, 1))
+    visited_list = []
+    current, path, position = start, [start], {start: 0}
+    for iteration in range(max_iterations):
+        if current == goal:
+            break
+        if iteration % 1024 == 0:
+            if should_stop is not None and should_stop():
+                break
+            draws = rng.random((1024, 2)).tolist()
+        propose, accept = draws[iteration % 1024]
+        visited_list.append(current)
+        x, y = current
+
+        options = [move for move in ((x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y)) if is_valid(move[0], move[1], grid)]
+        if not options:
+            break  # Celda aislada
+        candidate = options[int(propose * len(options))]
+        if manhattan_distance(candidate, goal) > manhattan_distance(current, goal) and accept >= math.exp(-1 / max(temperature, 1e-6)):
+            temperature *= cooling
+            continue
+        if candidate in position:
+            # Ciclo: se recorta el camino hasta la aparición anterior de la celda.
+            for cell in path[position[candidate] + 1:]:
+                del position[cell]
+            del path[position[candidate] + 1:]
+        else:
+            position[candidate] = len(path)
+            path.append(candidate)
+        current = candidate
+        temperature *= cooling
+
+    return (path if current == goal else []), visited_list
 
 def main():
     n = 10
     grid = initialize_grid(n)
     num_obstacles = (n * n) // 4
-    genera_obstaculos(grid, num_obstacles)
+    rng = make_rng()
+    genera_obstaculos(grid, num_obstacles, rng)
 
     try:
-        start, goal = genera_start_goal(grid)
+        start, goal = genera_start_goal(grid, rng)
     except ValueError as e:
         print(e)
         return
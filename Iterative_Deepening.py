@@ -0,0 +1,138 @@
+import numpy as np
+from array import array
+from Grid_Generator import STRAIGHT, DIAGONAL, DIAGONAL_MOVES, corner_allowed
+from Path_Codec import ids_to_cells, path_tuples
+
+# Entradas por defecto de la tabla de transposición (cada una ocupa 20 bytes: 20 MB en total).
+TABLE_SIZE = 1 << 20
+
+# Búsquedas con profundización iterativa cuya memoria es O(largo del camino) más una tabla de transposición
+# de tamaño fijo: no hay máscara de visitados ni arreglo de padres del tamaño de la cuadrícula, así que
+# sirven para cuadrículas enormes abiertas con Grid_Storage.open_grid (solo se leen las páginas que se tocan).
+# La tabla es de mapeo directo: la celda c va a la casilla c % tamaño y reemplaza lo que hubiera. Guarda
+# el menor costo con el que se llegó a cada celda en la iteración actual; llegar de nuevo sin mejorarlo
+# se poda. Perder una entrada por reemplazo solo cuesta repetir trabajo, nunca cambia el resultado.
+
+
+def _neighbor_steps(connectivity, corner):
+    # (dx, dy, costo) de cada movimiento; los diagonales se filtran con la regla de esquinas al expandir.
+    if connectivity not in (4, 8):
+        raise ValueError("La conectividad debe ser 4 u 8: " + str(connectivity))
+    straight = 1 if connectivity == 4 else STRAIGHT
+    steps = [(0, 1, straight), (0, -1, straight), (1, 0, straight), (-1, 0, straight)]
+    if connectivity == 8:
+        corner_allowed(True, True, corner)  # Valida la regla
+        steps += [(dx, dy, DIAGONAL) for dx, dy in DIAGONAL_MOVES]
+    return steps
+
+
+def _deepening(grid, start, goal, connectivity, corner, table_size, stats, estimate, next_limit, limit):
+    # Núcleo común: búsquedas en profundidad acotadas por 'limit' sobre f = g + estimate(celda), repetidas
+    # con el límite que devuelve next_limit(límite, menor f que se pasó del límite) hasta encontrar la meta.
+    # Devuelve la lista de ids del camino, o None si la búsqueda se agotó sin recortar nada.
+    cells = np.asarray(grid).reshape(-1)  # Vista plana: no copia una cuadrícula contigua ni un memmap
+    rows, cols = grid.shape
+    steps = _neighbor_steps(connectivity, corner)
+    start_id, goal_id = start[0] * cols + start[1], goal[0] * cols + goal[1]
+    if cells[start_id] or cells[goal_id]:
+        return None
+    if start_id == goal_id:
+        return [start_id]
+
+    table_keys = array('q', [-1]) * table_size
+    table_costs = array('q', [0]) * table_size
+    table_rounds = array('i', [0]) * table_size
+    expanded = generated = peak = 0
+
+    def children(cell_id, g):
+        # Vecinos libres con su costo, ordenados para que pop() saque primero el de menor estimación.
+        x, y = divmod(cell_id, cols)
+        result = []
+        for dx, dy, cost in steps:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < rows and 0 <= ny < cols and not cells[nx * cols + ny]:
+                if dx and dy and not corner_allowed(not cells[nx * cols + y], not cells[x * cols + ny], corner):
+                    continue
+                result.append((g + cost + estimate(nx, ny), g + cost, nx * cols + ny))
+        result.sort(reverse=True)
+        return result
+
+    try:
+        current_round = 0
+        while True:
+            current_round += 1
+            exceeded = None  # Menor f que se pasó del límite en esta iteración
+            path = [start_id]
+            on_path = {start_id}
+            frames = [children(start_id, 0)]
+            expanded += 1
+            while frames:
+                pending = frames[-1]
+                if not pending:
+                    frames.pop()
+                    on_path.discard(path.pop())
+                    continue
+                f, g, neighbor = pending.pop()
+                generated += 1
+                slot = neighbor % table_size
+                if table_keys[slot] == neighbor and table_rounds[slot] == current_round and table_costs[slot] <= g:
+                    continue  # Ya se llegó antes con un costo igual o menor
+                if f > limit:
+                    # Solo cuenta para el siguiente límite si esta llegada podría ser la mejor a esa celda.
+                    if exceeded is None or f < exceeded:
+                        exceeded = f
+                    continue
+                if neighbor in on_path:
+                    continue
+                table_keys[slot], table_costs[slot], table_rounds[slot] = neighbor, g, current_round
+                if neighbor == goal_id:
+                    return path + [neighbor]
+                path.append(neighbor)
+                on_path.add(neighbor)
+                frames.append(children(neighbor, g))
+                expanded += 1
+                if len(path) > peak:
+                    peak = len(path)
+            if exceeded is None:
+                return None  # Nada quedó fuera del límite: no hay camino
+            limit = next_limit(limit, exceeded)
+    finally:
+        if stats is not None:
+            stats.expanded += expanded
+            stats.generated += generated
+            stats.peak_frontier = max(stats.peak_frontier, peak)
+
+
+def _estimate(goal, connectivity):
+    # Cota inferior del costo hasta la meta: manhattan con 4 vecinos, octil con 8.
+    gx, gy = goal
+    if connectivity == 4:
+        return lambda x, y: abs(x - gx) + abs(y - gy)
+    return lambda x, y: STRAIGHT * max(abs(x - gx), abs(y - gy)) + (DIAGONAL - STRAIGHT) * min(abs(x - gx), abs(y - gy))
+
+
+def ida_star(grid, start, goal, stats=None, components=None, connectivity=4, corner='none', table_size=TABLE_SIZE):
+    # IDA*: búsquedas en profundidad acotadas por f = g + h, con h la manhattan (octil con 8 vecinos); cada
+    # iteración sube el límite al menor f que lo superó. Devuelve un camino óptimo, como a_star, o None.
+    # La memoria es O(largo del camino) más la tabla de transposición ('table_size' entradas).
+    # Sin camino hay que agotar la componente del inicio muchas veces, así que conviene pasar 'components'.
+    if components is not None and not components.reachable(start, goal):
+        return None
+    estimate = _estimate(goal, connectivity)
+    ids = _deepening(grid, start, goal, connectivity, corner, table_size, stats, estimate,
+                     lambda limit, exceeded: exceeded, estimate(*start))
+    return None if ids is None else path_tuples(ids_to_cells(ids, grid.shape[1]))
+
+
+def iddfs(grid, start, goal, stats=None, components=None, connectivity=4, corner='none', table_size=TABLE_SIZE,
+          depth=64):
+    # DFS con profundización iterativa: búsquedas en profundidad limitadas a 'depth' pasos, duplicando el
+    # límite hasta llegar a la meta. Como dfs, devuelve el primer camino que encuentra (no necesariamente
+    # el más corto, pero a lo sumo del largo del límite), o [] si no hay. No guarda la lista de visitados.
+    # Una rama se corta en cuanto la meta queda más lejos que lo que falta del límite (misma cota que
+    # ida_star), así que cada iteración recorre la elipse alrededor del inicio y la meta y no todo el radio.
+    if components is not None and not components.reachable(start, goal):
+        return []
+    ids = _deepening(grid, start, goal, connectivity, corner, table_size, stats, _estimate(goal, connectivity),
+                     lambda limit, exceeded: max(2 * limit, exceeded), depth * (1 if connectivity == 4 else STRAIGHT))
+    return [] if ids is None else path_tuples(ids_to_cells(ids, grid.shape[1]))
@@ -0,0 +1,82 @@
+import numpy as np
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from Batch_Search import _share
+from Hill_Climbing import random_restart_climbing, simulated_annealing
+
+# Escaladores estocásticos disponibles; todos reciben (grid, start, goal, max_iterations, rng, should_stop=...).
+CLIMBERS = {
+    'restart': random_restart_climbing,
+    'annealing': simulated_annealing,
+}
+
+# Cuadrícula y señal de parada compartidas del proceso trabajador (se asignan en _attach).
+_shared = {}
+
+
+def _attach(grid_spec, stop):
+    # Inicializador de cada trabajador: abre la cuadrícula en memoria compartida y guarda la señal de parada.
+    name, shape, dtype = grid_spec
+    shm = shared_memory.SharedMemory(name=name)
+    _shared['shm'] = shm
+    _shared['grid'] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _shared['stop'] = stop
+
+
+def _climb(mode, start, goal, max_iterations, seed, options):
+    # Un escalador en un trabajador: abandona en cuanto otro proceso activa la señal de parada.
+    return CLIMBERS[mode](_shared['grid'], start, goal, max_iterations, np.random.default_rng(seed),
+                          should_stop=_shared['stop'].is_set, **options)
+
+
+def parallel_climbing(grid, start, goal, max_iterations, mode='restart', climbers=None, workers=None,
+                      seed=None, timeout=None, **options):
+    # Lanza 'climbers' escaladores independientes (cada uno con su propia semilla, derivada de 'seed') en
+    # un grupo de procesos. El primero que llega a la meta gana: se activa la señal de parada, los demás
+    # abandonan en menos de 1024 pasos y los que aún no empezaban se cancelan. 'timeout' (segundos) acota
+    # la latencia total. 'options' se pasan al escalador (noise, temperature, cooling).
+    # Devuelve (camino, visitados) del ganador, como hill_climbing; ([], []) si ninguno llegó.
+    if mode not in CLIMBERS:
+        raise ValueError("Modo de ascenso desconocido: " + str(mode))
+    workers = workers or os.cpu_count() or 1
+    climbers = climbers or 4 * workers
+    seeds = np.random.SeedSequence(seed).spawn(climbers)
+    deadline = None if timeout is None else time.perf_counter() + timeout
+
+    if workers == 1:
+        # Sin procesos: los escaladores se prueban uno tras otro hasta que alguno llega o se acaba el tiempo.
+        expired = None if deadline is None else (lambda: time.perf_counter() > deadline)
+        for child in seeds:
+            path, visited = CLIMBERS[mode](grid, start, goal, max_iterations, np.random.default_rng(child),
+                                           should_stop=expired, **options)
+            if path or (expired is not None and expired()):
+                return path, visited
+        return [], []
+
+    stop = multiprocessing.get_context().Event()
+    result = [], []
+    shm, grid_spec = _share(np.ascontiguousarray(grid, dtype=np.uint8))
+    try:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(grid_spec, stop))
+        try:
+            pending = {pool.submit(_climb, mode, start, goal, max_iterations, child, options) for child in seeds}
+            while pending and not result[0]:
+                remaining = None if deadline is None else max(deadline - time.perf_counter(), 0)
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    break  # Se acabó el tiempo
+                for future in done:
+                    if future.result()[0]:
+                        result = future.result()
+                        break
+        finally:
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
@@ -0,0 +1,101 @@
+import numpy as np
+from array import array
+import struct
+
+# Caminos compactos. Un camino como lista de tuplas ocupa unos 100 bytes por paso; como arreglo (L, 2)
+# de int32, 8 bytes. La codificación por tramos guarda la celda de inicio y, por cada tramo recto, la
+# dirección (0-7) y cuántos pasos se repite: un camino de un millón de pasos con tramos largos cabe en KB.
+
+# Desplazamiento de cada código de dirección: los cuatro rectos en el orden de a_star y luego las diagonales.
+DIRECTIONS = np.array([(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)], dtype=np.int32)
+
+# Código de cada paso indexado por (dx + 1) * 3 + (dy + 1); -1 si no es un paso a una celda vecina.
+_CODE_OF_STEP = np.full(9, -1, dtype=np.int8)
+_CODE_OF_STEP[(DIRECTIONS[:, 0] + 1) * 3 + DIRECTIONS[:, 1] + 1] = np.arange(len(DIRECTIONS))
+
+# Formato binario de pack_path: cabecera (x, y, cantidad de tramos) y una palabra de 32 bits por tramo
+# con largo << 3 | dirección.
+_HEADER = struct.Struct('<iiI')
+MAX_RUN = (1 << 29) - 1
+
+
+def trace_parents(parent, cell_id, root=-1, offset=0):
+    # Ids desde la raíz hasta cell_id siguiendo 'parent' (arreglo o lista), como arreglo int32 en
+    # O(largo del camino): se agrega al final y se invierte una vez, sin insertar al principio.
+    # Termina en 'root' o en la celda sin padre (-1). 'offset' se resta a cada padre leído
+    # (SearchState guarda id + 1 para que 0 sea "sin padre").
+    get = parent.item if isinstance(parent, np.ndarray) else parent.__getitem__
+    ids = array('i')
+    while cell_id != -1:
+        ids.append(cell_id)
+        if cell_id == root:
+            break
+        cell_id = get(cell_id) - offset
+    return np.frombuffer(ids, dtype=np.int32)[::-1].copy()
+
+
+def ids_to_cells(ids, width, border=0):
+    # Arreglo (L, 2) int32 de coordenadas a partir de ids planos de una cuadrícula de 'width' columnas
+    # ('border' descuenta el borde de las máscaras de Grid_Generator.padded_free).
+    ids = np.asarray(ids, dtype=np.int64)
+    cells = np.empty((ids.size, 2), dtype=np.int32)
+    np.floor_divide(ids, width, out=cells[:, 0], casting='unsafe')
+    np.remainder(ids, width, out=cells[:, 1], casting='unsafe')
+    if border:
+        cells -= border
+    return cells
+
+
+def path_array(path):
+    # Camino (lista de tuplas o arreglo) como arreglo (L, 2) int32.
+    return np.asarray(path, dtype=np.int32).reshape(-1, 2)
+
+
+def path_tuples(cells):
+    # Camino como lista de tuplas (x, y), el formato que devuelven los motores.
+    cells = path_array(cells)
+    return list(zip(cells[:, 0].tolist(), cells[:, 1].tolist()))
+
+
+def encode_path(path):
+    # Devuelve (inicio, códigos, largos): la celda de inicio y, por cada tramo de pasos iguales, su
+    # dirección (uint8, índice en DIRECTIONS) y su largo (uint32). Sirve para 4 u 8 vecinos.
+    cells = path_array(path)
+    if not len(cells):
+        raise ValueError("No se puede codificar un camino vacío.")
+    steps = np.diff(cells, axis=0)
+    if len(steps) and np.abs(steps).max() > 1:
+        raise ValueError("El camino tiene un salto entre celdas que no son vecinas.")
+    codes = _CODE_OF_STEP[(steps[:, 0] + 1) * 3 + steps[:, 1] + 1]
+    if (codes < 0).any():
+        raise ValueError("El camino repite una celda en pasos consecutivos.")
+    starts = np.flatnonzero(np.diff(codes, prepend=-1))
+    runs = np.diff(starts, append=len(codes)).astype(np.uint32)
+    return (int(cells[0, 0]), int(cells[0, 1])), codes[starts].astype(np.uint8), runs
+
+
+def decode_path(start, codes, runs):
+    # Inversa de encode_path: arreglo (L, 2) int32 con todas las celdas del camino.
+    steps = np.repeat(DIRECTIONS[np.asarray(codes, dtype=np.intp)], np.asarray(runs, dtype=np.intp), axis=0)
+    cells = np.empty((len(steps) + 1, 2), dtype=np.int32)
+    cells[0] = start
+    np.cumsum(steps, axis=0, out=cells[1:])
+    cells[1:] += cells[0]
+    return cells
+
+
+def pack_path(path):
+    # encode_path como bytes, para guardar o enviar: 12 bytes de cabecera más 4 por tramo.
+    start, codes, runs = encode_path(path)
+    if len(runs) and runs.max() > MAX_RUN:
+        # Un tramo recto no pasa por la misma celda dos veces: solo ocurre en cuadrículas de más de 2^29 de lado.
+        raise ValueError("Tramo demasiado largo para pack_path: " + str(int(runs.max())))
+    words = (runs.astype('<u4') << 3) | codes
+    return _HEADER.pack(start[0], start[1], len(words)) + words.tobytes()
+
+
+def unpack_path(data):
+    # Inversa de pack_path: arreglo (L, 2) int32.
+    x, y, count = _HEADER.unpack_from(data)
+    words = np.frombuffer(data, dtype='<u4', count=count, offset=_HEADER.size)
+    return decode_path((x, y), words & 7, words >> 3)
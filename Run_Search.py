@@ -0,0 +1,161 @@
+import argparse
+import base64
+import contextlib
+import json
+import sys
+import time
+
+import numpy as np
+
+from Batch_Search import ENGINES as BATCH_ENGINES
+from Components import ComponentIndex
+from Grid_Generator import generate_scenario, make_rng, sample_start_goal
+from Grid_Storage import open_grid
+from Hill_Climbing import hill_climbing_path
+from Path_Codec import pack_path
+
+# Motores disponibles: los de Batch_Search (reciben el índice de componentes) más el ascenso de colina,
+# con el mismo tope que Benchmark.py (N^2/4 pasos, y se corta al quedarse sin movimientos).
+ENGINES = dict(BATCH_ENGINES)
+ENGINES['hill_climbing'] = lambda grid, start, goal, components: hill_climbing_path(grid, start, goal, components=components)
+
+# Motores a los que run() les construye el índice de componentes; los demás reciben None y no pagan por
+# etiquetar la cuadrícula completa.
+COMPONENT_ENGINES = frozenset(BATCH_ENGINES)
+
+
+def load_grid(path):
+    # Lee una cuadrícula de un .npy (con memoria mapeada) o del formato de Grid_Storage.
+    if str(path).endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+    return open_grid(path)
+
+
+def scenarios(sizes, density, seed, runs, grids=()):
+    # Produce (origen, cuadrícula, inicio, meta, semilla) para cada corrida. La corrida i usa la semilla
+    # seed + i, así que repetir la misma línea de comandos da exactamente los mismos casos.
+    # Con archivos de cuadrícula se sortean 'runs' pares (inicio, meta) sobre cada uno; si no, se genera
+    # una cuadrícula por corrida y tamaño con generate_scenario.
+    for path in grids:
+        grid = load_grid(path)
+        for run in range(runs):
+            start, goal = sample_start_goal(grid, make_rng(seed + run))
+            yield str(path), grid, start, goal, seed + run
+    if not grids:
+        for size in sizes:
+            for run in range(runs):
+                grid, start, goal = generate_scenario(size, density, seed + run)
+                yield None, grid, start, goal, seed + run
+
+
+def run(engine, cases):
+    # Resuelve cada caso con el motor y produce una fila de resultados y su camino (lista de tuplas,
+    # vacía si no se llegó a la meta). El índice de componentes (solo para COMPONENT_ENGINES) y la
+    # densidad se calculan una vez por cuadrícula, fuera del tiempo medido.
+    solve = ENGINES[engine]
+    grid_seen, components, density = None, None, None
+    for source, grid, start, goal, seed in cases:
+        if grid is not grid_seen:
+            grid_seen = grid
+            components = ComponentIndex(grid) if engine in COMPONENT_ENGINES else None
+            density = round(float(np.count_nonzero(grid)) / grid.size, 6)
+        # Los motores que avisan por pantalla (hill_climbing) no deben mezclarse con la salida JSON.
+        with contextlib.redirect_stdout(sys.stderr):
+            started = time.perf_counter()
+            path = solve(grid, start, goal, components)
+            elapsed = time.perf_counter() - started
+        found = bool(path) and tuple(path[-1]) == tuple(goal)
+        row = {
+            'engine': engine,
+            'grid': source,
+            'rows': int(grid.shape[0]),
+            'cols': int(grid.shape[1]),
+            'density': density,
+            'seed': seed,
+            'start': [int(start[0]), int(start[1])],
+            'goal': [int(goal[0]), int(goal[1])],
+            'time': elapsed,
+            'found': found,
+            'path_length': len(path) if found else None,
+        }
+        yield row, (path if found else [])
+
+
+def write_jsonl(results, handle, paths=False):
+    # Una línea JSON por corrida; con paths=True se incluye el camino como lista de [x, y], y con
+    # paths='packed' como el texto base64 de Path_Codec.pack_path (None si no hubo camino).
+    for row, path in results:
+        if paths == 'packed':
+            row = dict(row, path=base64.b64encode(pack_path(path)).decode('ascii') if path else None)
+        elif paths:
+            row = dict(row, path=[[int(x), int(y)] for x, y in path])
+        handle.write(json.dumps(row) + '\n')
+        yield row
+
+
+def write_npz(results, path):
+    # Un solo .npz con una fila por corrida y los caminos en el formato de solve_batch
+    # (longitudes, offsets, celdas).
+    rows, cells = [], []
+    for row, found_path in results:
+        rows.append(row)
+        if found_path:
+            cells.append(np.asarray(found_path, dtype=np.int32).reshape(-1, 2))
+        yield row
+    lengths = np.array([row['path_length'] or -1 for row in rows], dtype=np.int32)
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(np.maximum(lengths, 0), out=offsets[1:])
+    np.savez(path,
+             engine=np.array([row['engine'] for row in rows]),
+             seeds=np.array([row['seed'] for row in rows], dtype=np.int64),
+             shapes=np.array([(row['rows'], row['cols']) for row in rows], dtype=np.int64).reshape(-1, 2),
+             densities=np.array([row['density'] for row in rows]),
+             starts=np.array([row['start'] for row in rows], dtype=np.int32).reshape(-1, 2),
+             goals=np.array([row['goal'] for row in rows], dtype=np.int32).reshape(-1, 2),
+             times=np.array([row['time'] for row in rows]),
+             lengths=lengths,
+             offsets=offsets,
+             cells=np.concatenate(cells) if cells else np.empty((0, 2), dtype=np.int32))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ejecuta búsquedas sin ventanas sobre cuadrículas con semilla "
+                                                 "o cargadas de archivo y escribe los resultados.")
+    parser.add_argument('--engine', default='a_star', choices=sorted(ENGINES))
+    parser.add_argument('--size', nargs='+', type=int, default=[10], help="Lado de las cuadrículas generadas.")
+    parser.add_argument('--density', type=float, default=0.25, help="Fracción de obstáculos de las cuadrículas generadas.")
+    parser.add_argument('--seed', type=int, default=0, help="Semilla de la primera corrida (la corrida i usa seed + i).")
+    parser.add_argument('--runs', type=int, default=1, help="Corridas por tamaño (o por archivo de cuadrícula).")
+    parser.add_argument('--grid', nargs='+', default=[], help="Archivos de cuadrícula (.npy o de Grid_Storage) en vez de generarlas.")
+    parser.add_argument('--format', choices=['jsonl', 'npz'], default='jsonl')
+    parser.add_argument('--output', default='-', help="Archivo de salida ('-' es la salida estándar, solo para jsonl).")
+    parser.add_argument('--paths', nargs='?', const='list', choices=['list', 'packed'],
+                        help="Incluir los caminos en cada línea JSON: como lista de [x, y] o, con 'packed', "
+                             "codificados por tramos en base64 (Path_Codec.unpack_path).")
+    args = parser.parse_args(argv)
+    if args.format == 'npz' and args.output == '-':
+        parser.error("--format npz necesita --output")
+
+    cases = scenarios(args.size, args.density, args.seed, args.runs, args.grid)
+    results = run(args.engine, cases)
+    started = time.perf_counter()
+    count = found = solving = 0
+    with contextlib.ExitStack() as stack:
+        if args.format == 'npz':
+            rows = write_npz(results, args.output)
+        else:
+            handle = sys.stdout if args.output == '-' else stack.enter_context(open(args.output, 'w'))
+            rows = write_jsonl(results, handle, args.paths)
+        for row in rows:
+            count += 1
+            found += row['found']
+            solving += row['time']
+
+    total = time.perf_counter() - started
+    print("{}: {} corridas, {} con camino, {:.3f}s buscando, {:.3f}s en total ({:.1f} corridas/s)".format(
+        args.engine, count, found, solving, total, count / max(total, 1e-9)), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+import mmap
+import tracemalloc
+import numpy as np
+from Grid_Generator import DIAGONAL_MOVES, corner_allowed
+from Path_Codec import trace_parents, ids_to_cells, path_tuples
+
+# Valor usado como "infinito" en los arreglos de g (cabe en int32).
+INF = np.iinfo(np.int32).max
+
+# A partir de este tamaño los arreglos del estado se piden al sistema con un mmap anónimo.
+LAZY_BYTES = 1 << 20
+
+
+def lazy_zeros(size, dtype):
+    # Arreglo en cero cuyo costo de creación no depende del tamaño: un mmap anónimo recibe del sistema
+    # páginas en cero solo cuando se tocan. np.zeros a veces reutiliza memoria ya liberada y la pone en
+    # cero completa, lo que en una cuadrícula grande costaría más que una búsqueda corta.
+    # tracemalloc no ve los mmap: mientras mide (Benchmark.py) se usa np.zeros para que la memoria cuente.
+    nbytes = size * np.dtype(dtype).itemsize
+    if nbytes < LAZY_BYTES or tracemalloc.is_tracing():
+        return np.zeros(size, dtype=dtype)
+    return np.frombuffer(mmap.mmap(-1, nbytes), dtype=dtype)
+
+
+class SearchState:
+    # Estado compacto de una búsqueda sobre una cuadrícula.
+    # Cada celda se identifica con un entero id = x * columnas + y, en lugar de una tupla (x, y).
+    #   cells:   vista plana de la cuadrícula (0 = libre); no se copia si la cuadrícula es contigua,
+    #            así una cuadrícula abierta con Grid_Storage.open_grid solo carga las páginas que se tocan
+    #   visited: máscara de celdas visitadas (bool, 1 byte por celda)
+    #   parent:  id del padre + 1 de cada celda, 0 si no tiene (int32, 4 bytes por celda)
+    #   g:       costo acumulado + 1, 0 si la celda no se alcanzó; solo se crea si el algoritmo lo pide
+    #            (int32, 4 bytes por celda)
+    # Todos los arreglos empiezan en 0 y se crean con lazy_zeros: una consulta paga por las páginas que toca
+    # y no por el tamaño de la cuadrícula (np.full escribiría toda la cuadrícula en cada consulta).
+
+    def __init__(self, grid, with_g=False):
+        self.rows, self.cols = grid.shape
+        self.size = self.rows * self.cols
+        self.cells = np.asarray(grid).reshape(-1)
+        self.visited = lazy_zeros(self.size, bool)
+        self.parent = lazy_zeros(self.size, np.int32)
+        self.g = lazy_zeros(self.size, np.int32) if with_g else None
+
+    def cell_id(self, cell):
+        return cell[0] * self.cols + cell[1]
+
+    def coords(self, cell_id):
+        return divmod(int(cell_id), self.cols)
+
+    def neighbors(self, cell_id, moves):
+        # Devuelve los ids de los vecinos libres en el orden de 'moves' (lista de (dx, dy)).
+        x, y = divmod(cell_id, self.cols)
+        result = []
+        for dx, dy in moves:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.rows and 0 <= ny < self.cols:
+                neighbor = nx * self.cols + ny
+                if not self.cells[neighbor]:
+                    result.append(neighbor)
+        return result
+
+    def diagonal_neighbors(self, cell_id, corner='none'):
+        # Ids de los vecinos diagonales libres que permite la regla de esquinas (ver Grid_Generator.CORNER_RULES).
+        x, y = divmod(cell_id, self.cols)
+        cells, cols = self.cells, self.cols
+        result = []
+        for dx, dy in DIAGONAL_MOVES:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.rows and 0 <= ny < cols and not cells[nx * cols + ny]:
+                if corner_allowed(not cells[nx * cols + y], not cells[x * cols + ny], corner):
+                    result.append(nx * cols + ny)
+        return result
+
+    def path_ids(self, goal_id):
+        # Ids desde la raíz hasta goal_id siguiendo los padres, como arreglo int32 (O(largo del camino)).
+        return trace_parents(self.parent, goal_id, offset=1)
+
+    def path_array(self, goal_id):
+        # Camino hasta goal_id como arreglo (L, 2) int32: 8 bytes por paso en lugar de una tupla.
+        return ids_to_cells(self.path_ids(goal_id), self.cols)
+
+    def path_to(self, goal_id):
+        # Sigue los padres desde la meta hasta la raíz y devuelve el camino como tuplas (x, y).
+        return path_tuples(self.path_array(goal_id))
+
+    def nbytes(self):
+        # Memoria ocupada por los arreglos propios del estado (la cuadrícula no cuenta: es una vista).
+        total = self.visited.nbytes + self.parent.nbytes
+        if self.g is not None:
+            total += self.g.nbytes
+        return total
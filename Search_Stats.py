@@ -0,0 +1,105 @@
+import time
+
+
+class SearchStats:
+    # Contadores de una búsqueda y ganchos opcionales para observarla.
+    #   expanded:       nodos expandidos (se generaron sus vecinos)
+    #   generated:      nodos insertados en la frontera
+    #   peak_frontier:  tamaño máximo que alcanzó la frontera
+    #   reopened:       entradas obsoletas descartadas en a_star (nodos reinsertados con un g mejor)
+    #   neighbor_time:  segundos generando vecinos (solo con timing=True)
+    #   open_set_time:  segundos en operaciones de la frontera (solo con timing=True)
+    #   stuck:          True si ascenso de colina agotó sus iteraciones sin llegar a la meta
+    # Ganchos: on_expand(celda) y on_generate(celda), con celda como tupla (x, y).
+    #
+    # Los motores reciben stats=None por defecto. En ese caso no se envuelve nada y el costo es cero;
+    # con un SearchStats, los motores sustituyen sus funciones de frontera y de vecinos por las
+    # versiones instrumentadas que devuelven frontier_push, frontier_pop y expansion.
+
+    def __init__(self, timing=False, on_expand=None, on_generate=None):
+        self.timing = timing
+        self.on_expand = on_expand
+        self.on_generate = on_generate
+        self.expanded = 0
+        self.generated = 0
+        self.peak_frontier = 0
+        self.reopened = 0
+        self.neighbor_time = 0.0
+        self.open_set_time = 0.0
+        self.stuck = False
+
+    def frontier_push(self, push, frontier, to_cell=None):
+        # Envuelve la inserción en la frontera: cuenta, mide el tamaño máximo y llama a on_generate.
+        # 'to_cell' convierte el elemento insertado (último argumento de 'push') en una tupla (x, y).
+        clock = time.perf_counter if self.timing else None
+        on_generate = self.on_generate
+
+        def wrapped(*args):
+            if clock:
+                started = clock()
+                push(*args)
+                self.open_set_time += clock() - started
+            else:
+                push(*args)
+            self.generated += 1
+            if len(frontier) > self.peak_frontier:
+                self.peak_frontier = len(frontier)
+            if on_generate:
+                on_generate(to_cell(args[-1]) if to_cell else args[-1])
+
+        return wrapped
+
+    def frontier_pop(self, pop):
+        # Envuelve la extracción de la frontera para medir su tiempo.
+        if not self.timing:
+            return pop
+        clock = time.perf_counter
+
+        def wrapped(*args):
+            started = clock()
+            item = pop(*args)
+            self.open_set_time += clock() - started
+            return item
+
+        return wrapped
+
+    def expansion(self, neighbors, to_cell=None):
+        # Envuelve la generación de vecinos de un nodo: cuenta la expansión y llama a on_expand.
+        clock = time.perf_counter if self.timing else None
+        on_expand = self.on_expand
+
+        def wrapped(cell, *args):
+            self.expanded += 1
+            if on_expand:
+                on_expand(to_cell(cell) if to_cell else cell)
+            if clock:
+                started = clock()
+                result = neighbors(cell, *args)
+                self.neighbor_time += clock() - started
+                return result
+            return neighbors(cell, *args)
+
+        return wrapped
+
+    def as_dict(self):
+        return {
+            'expanded': self.expanded,
+            'generated': self.generated,
+            'peak_frontier': self.peak_frontier,
+            'reopened': self.reopened,
+            'neighbor_time': self.neighbor_time,
+            'open_set_time': self.open_set_time,
+            'stuck': self.stuck,
+        }
+
+
+def collect_events(events):
+    # Consume un generador de eventos (celda, orden, frontera) de los motores *_events y devuelve
+    # (visitados, camino): la lista de celdas en orden de expansión y el valor que devolvió el generador.
+    visited = []
+    append = visited.append
+    while True:
+        try:
+            append(next(events)[0])
+        except StopIteration as finished:
+            return visited, finished.value
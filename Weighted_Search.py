@@ -0,0 +1,161 @@
+import numpy as np
+import heapq
+import time
+from Search_State import SearchState
+
+# Cuadrículas con costo: la cuadrícula sigue marcando los obstáculos (distinto de 0) y un arreglo
+# 'costs' de la misma forma da el costo entero (>= 1) de entrar a cada celda libre. Con todos los
+# costos en 1 los caminos tienen la misma longitud que los de a_star.
+
+
+def _cost_bounds(costs):
+    # Costo mínimo (para la heurística) y máximo (para el número de cubetas) con dos reducciones sobre el
+    # arreglo, sin copiar ni enmascarar: un costo menor que 1 en un obstáculo no importa (el mínimo se
+    # sube a 1, que sigue siendo una cota válida) y en una celda libre se detecta al entrar en ella.
+    if not costs.size:
+        return 1, 1
+    return max(int(costs.min()), 1), max(int(costs.max()), 1)
+
+
+def weighted_search(grid, start, goal, costs, heuristic=True, queue='bucket', stats=None, components=None):
+    # Camino de costo mínimo (suma de los costos de las celdas a las que se entra) o None si no hay.
+    # Con heuristic=False es Dijkstra; con True es A* con la manhattan por el costo mínimo.
+    # queue='bucket' usa una cola de Dial: como cada inserción tiene una clave entre la mínima actual y
+    # la mínima + (costo máximo + peso de la heurística), basta un arreglo circular de esa cantidad + 1
+    # de cubetas y cada operación es O(1) amortizada. queue='heap' usa heapq (para comparar).
+    if queue not in ('bucket', 'heap'):
+        raise ValueError("Cola desconocida: " + str(queue))
+    grid = np.asarray(grid)
+    costs = np.asarray(costs)
+    if costs.shape != grid.shape:
+        raise ValueError("Los costos deben tener la forma de la cuadrícula: " + str(costs.shape))
+    if components is not None and not components.reachable(start, goal):
+        return None
+    # Estado perezoso de Search_State: g + 1 y padre + 1 en cero, así que una consulta corta solo toca
+    # las páginas de las celdas que alcanza, y la cuadrícula y los costos se leen sin copiarlos.
+    state = SearchState(grid, with_g=True)
+    rows, cols = state.rows, state.cols
+    cells, step = memoryview(state.cells), memoryview(costs.reshape(-1))
+    g, parent, closed = memoryview(state.g), memoryview(state.parent), memoryview(state.visited)
+    start_id, goal_id = state.cell_id(start), state.cell_id(goal)
+    if cells[start_id] or cells[goal_id]:
+        return None
+    low, high = _cost_bounds(costs)
+    # Heurística: manhattan por el costo mínimo (nunca sobreestima y es consistente); 0 en Dijkstra.
+    gx, gy = goal
+    weight = low if heuristic else 0
+    start_key = weight * (abs(start[0] - gx) + abs(start[1] - gy))
+
+    moves = ((0, 1, 1), (0, -1, -1), (1, 0, cols), (-1, 0, -cols))  # Misma prioridad de movimientos que a_star
+    g[start_id] = 1
+    on_expand = stats.on_expand if stats is not None else None
+    started = time.perf_counter() if stats is not None and stats.timing else None
+    expanded = generated = peak = reopened = 0
+
+    # El cuerpo del bucle está escrito dos veces (cubetas y montículo) para que las operaciones de la
+    # frontera queden en línea: una llamada a función por inserción se comería la ventaja de las cubetas.
+    if queue == 'bucket':
+        # Cubetas LIFO: a igual f se expande primero lo más reciente (más profundo), lo que favorece
+        # llegar antes a la meta.
+        span = high + weight + 1
+        buckets = [[] for _ in range(span)]
+        key = start_key
+        buckets[key % span].append(start_id)
+        size = 1
+        while size:
+            bucket = buckets[key % span]
+            if not bucket:
+                key += 1
+                continue
+            current = bucket.pop()
+            size -= 1
+            if closed[current]:
+                reopened += 1
+                continue  # Entrada obsoleta: ya se expandió con un g mejor
+            if current == goal_id:
+                break
+            closed[current] = True
+            expanded += 1
+            x, y = divmod(current, cols)
+            if on_expand:
+                on_expand((x, y))
+            base = g[current] - 1
+            for dx, dy, shift in moves:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < rows and 0 <= ny < cols and not cells[current + shift]:
+                    neighbor = current + shift
+                    cost = step[neighbor]
+                    if cost < 1:
+                        raise ValueError("Los costos de las celdas libres deben ser enteros >= 1.")
+                    known = g[neighbor]
+                    if not known or base + cost < known - 1:
+                        g[neighbor] = base + cost + 1
+                        parent[neighbor] = current + 1
+                        f = base + cost + weight * (abs(nx - gx) + abs(ny - gy))
+                        buckets[f % span].append(neighbor)
+                        size += 1
+                        generated += 1
+            if size > peak:
+                peak = size
+    else:
+        heap = [(start_key, start_id)]
+        while heap:
+            _, current = heapq.heappop(heap)
+            if closed[current]:
+                reopened += 1
+                continue
+            if current == goal_id:
+                break
+            closed[current] = True
+            expanded += 1
+            x, y = divmod(current, cols)
+            if on_expand:
+                on_expand((x, y))
+            base = g[current] - 1
+            for dx, dy, shift in moves:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < rows and 0 <= ny < cols and not cells[current + shift]:
+                    neighbor = current + shift
+                    cost = step[neighbor]
+                    if cost < 1:
+                        raise ValueError("Los costos de las celdas libres deben ser enteros >= 1.")
+                    known = g[neighbor]
+                    if not known or base + cost < known - 1:
+                        g[neighbor] = base + cost + 1
+                        parent[neighbor] = current + 1
+                        f = base + cost + weight * (abs(nx - gx) + abs(ny - gy))
+                        heapq.heappush(heap, (f, neighbor))
+                        generated += 1
+            if len(heap) > peak:
+                peak = len(heap)
+
+    if stats is not None:
+        stats.expanded += expanded
+        stats.generated += generated
+        stats.peak_frontier = max(stats.peak_frontier, peak)
+        stats.reopened += reopened
+        if started is not None:
+            # La frontera está en línea con la expansión: todo el bucle cuenta como generación de vecinos.
+            stats.neighbor_time += time.perf_counter() - started
+
+    if not g[goal_id]:
+        return None  # No se encontró un camino válido
+    return state.path_to(goal_id)
+
+
+def dijkstra(grid, start, goal, costs, stats=None, components=None, queue='bucket'):
+    # Dijkstra sobre una cuadrícula con costos, con cola de cubetas por defecto.
+    return weighted_search(grid, start, goal, costs, False, queue, stats, components)
+
+
+def weighted_a_star(grid, start, goal, costs, stats=None, components=None, queue='bucket'):
+    # A* sobre una cuadrícula con costos (heurística admisible: da el mismo costo que dijkstra).
+    return weighted_search(grid, start, goal, costs, True, queue, stats, components)
+
+
+def path_cost(costs, path):
+    # Costo de un camino: suma de los costos de cada celda a la que se entra (el inicio no cuenta).
+    if not path:
+        return None
+    cells = np.asarray(path[1:], dtype=np.int64).reshape(-1, 2)
+    return int(np.asarray(costs)[cells[:, 0], cells[:, 1]].sum())